@@ -0,0 +1,48 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+
+def cold_import_ms(module: str) -> float:
+    # Fresh interpreter each run so nothing is already in sys.modules
+    code = f"import time; t = time.perf_counter(); import {module}; print((time.perf_counter() - t) * 1000)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def slowest_imports(module: str, top: int):
+    # Parses `python -X importtime` output: "import time: self [us] | cumulative | name"
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        rows.append((int(parts[1]), int(parts[0]), parts[2].rstrip()))
+    rows.sort(reverse=True)
+    return rows[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure cold import time of the API worker")
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    samples = [cold_import_ms(args.module) for _ in range(args.runs)]
+    print(f"import {args.module}: median {statistics.median(samples):.0f} ms, min {min(samples):.0f} ms, max {max(samples):.0f} ms over {args.runs} runs")
+    print("\nSlowest imports (cumulative ms):")
+    for cumulative_us, self_us, name in slowest_imports(args.module, args.top):
+        print(f"  {cumulative_us / 1000:8.1f}  {name}")
+
+    # Tool modules that were imported at startup (should be none: they load on first use)
+    code = f"import sys, {args.module}; print(sorted(m for m in sys.modules if m.startswith('tools.') and m not in ('tools.base', 'tools.lazy', 'tools.registry')))"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    print(f"\nTool modules loaded at import: {out.stdout.strip().splitlines()[-1]}")
+
+
+if __name__ == "__main__":
+    main()
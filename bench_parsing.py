@@ -0,0 +1,136 @@
+import argparse
+import asyncio
+import glob
+import os
+import random
+import statistics
+import time
+from typing import Callable, Dict, List, Tuple
+
+from bs4 import BeautifulSoup
+
+from scraper import _parse_extras, _parse_profile, parse_github_page
+from services.parsing import parse_off_loop, parser_backend
+from tools.linkedin_verify import LinkedInVerifyTool
+
+
+def synthetic_github(seed: int = 0) -> bytes:
+    # Roughly the shape and size (~300 KB) of a rendered github.com/<user> page
+    rnd = random.Random(seed)
+    parts = ["<html><head>", "<style>" + "x{color:red}" * 4000 + "</style>", "<script>" + "var a=1;" * 6000 + "</script></head><body>"]
+    parts += [f'<nav><a href="/features/{i}">Feature {i}</a></nav>' for i in range(300)]
+    parts.append('<div class="vcard"><span itemprop="name">Octo Cat</span>')
+    parts.append('<div data-bio-text>Building things @octo_dev. Reach me at octo@example.com <a href="https://octo.dev">site</a></div>')
+    parts.append('<li itemprop="homeLocation">San Francisco, CA</li><li itemprop="worksFor">GitHub</li>')
+    parts.append('<a href="/octo/followers"><span class="text-bold">1,234</span> followers</a>')
+    parts.append('<a href="/octo/following"><span class="text-bold">56</span> following</a>')
+    parts.append('<a href="https://www.linkedin.com/in/octo">LinkedIn</a>')
+    parts.append('<div data-test-selector="profile-orgs"><a href="/github">gh</a><a href="/octo-org">o</a></div></div>')
+    for i in range(400):
+        words = " ".join(rnd.choice(["repo", "code", "commit", "star", "fork", "issue"]) for _ in range(12))
+        parts.append(f'<div class="repo"><h3><span class="repo-name">project-{i}</span></h3><p>{words}</p><svg><path d="M{i} 0L0 {i}Z"/></svg></div>')
+    parts.append("</body></html>")
+    return "".join(parts).encode()
+
+
+def synthetic_linkedin(seed: int = 0) -> str:
+    # Roughly the shape and size (~500 KB) of a JS-rendered public LinkedIn profile
+    rnd = random.Random(seed)
+    parts = ["<html><head>", "<script>" + "window.x=1;" * 9000 + "</script></head><body>"]
+    parts.append('<section class="top-card"><h1>Octo Cat</h1><div class="text-body-medium">Engineer at GitHub</div>')
+    parts.append('<span class="text-body-small">San Francisco, California</span><span>at GitHub</span>')
+    parts.append('<img src="https://media.licdn.com/dms/image/profile-displayphoto-shrink_400/octo.jpg"></section>')
+    for i in range(2500):
+        words = " ".join(rnd.choice(["experience", "skills", "team", "product", "growth", "people"]) for _ in range(8))
+        parts.append(f'<div class="feed-item"><div><p>{words}</p><a href="/feed/{i}">more</a></div></div>')
+    parts.append("</body></html>")
+    return "".join(parts)
+
+
+def load_samples(directory: str) -> Tuple[List[bytes], List[str]]:
+    github = [open(p, "rb").read() for p in sorted(glob.glob(os.path.join(directory, "github*.html")))]
+    linkedin = [open(p, encoding="utf-8", errors="replace").read() for p in sorted(glob.glob(os.path.join(directory, "linkedin*.html")))]
+    return github, linkedin
+
+
+def median_ms(fn: Callable[[], object], runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        t = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t) * 1000)
+    return statistics.median(samples)
+
+
+def github_full(content: bytes) -> Dict:
+    soup = BeautifulSoup(content, "html.parser")
+    return {"profile": _parse_profile(soup).model_dump(), "extras": _parse_extras(soup, "octo")}
+
+
+def linkedin_full(tool: LinkedInVerifyTool, html: str) -> Dict:
+    soup = BeautifulSoup(html, "html.parser")
+    return {
+        "name": tool._text(soup.select_one("h1")),
+        "headline": tool._text(soup.select_one("div.text-body-medium")),
+        "company": tool._guess_company(soup),
+        "photo": tool._guess_photo(soup),
+    }
+
+
+async def max_loop_lag(parse: Callable[[], object], off_loop: bool) -> float:
+    lag = 0.0
+    done = False
+
+    async def heartbeat() -> None:
+        nonlocal lag
+        while not done:
+            t = time.perf_counter()
+            await asyncio.sleep(0.005)
+            lag = max(lag, time.perf_counter() - t - 0.005)
+
+    beat = asyncio.ensure_future(heartbeat())
+    await asyncio.sleep(0.02)
+    if off_loop:
+        await parse_off_loop(parse)
+    else:
+        parse()
+    done = True
+    await beat
+    return lag * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare HTML parsing paths on saved or synthetic profile pages")
+    parser.add_argument("--samples", help="directory with saved github*.html / linkedin*.html pages")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    github, linkedin = load_samples(args.samples) if args.samples else ([], [])
+    if not github:
+        github = [synthetic_github()]
+    if not linkedin:
+        linkedin = [synthetic_linkedin()]
+    tool = LinkedInVerifyTool()
+    print(f"backend: {parser_backend()}  samples: {len(github)} github, {len(linkedin)} linkedin{'' if args.samples else ' (synthetic)'}")
+
+    for i, page in enumerate(github):
+        full = median_ms(lambda: github_full(page), args.runs)
+        targeted = median_ms(lambda: parse_github_page(page, "octo"), args.runs)
+        same = github_full(page) == parse_github_page(page, "octo")
+        print(f"github[{i}] {len(page) // 1024} KB: full html.parser {full:.1f} ms, targeted {targeted:.1f} ms ({full / targeted:.1f}x), same fields: {same}")
+
+    for i, page in enumerate(linkedin):
+        full = median_ms(lambda: linkedin_full(tool, page), args.runs)
+        targeted = median_ms(lambda: tool._parse(page, ""), args.runs)
+        parsed = tool._parse(page, "")
+        same = all(parsed[k] == v for k, v in linkedin_full(tool, page).items())
+        print(f"linkedin[{i}] {len(page) // 1024} KB: full html.parser {full:.1f} ms, targeted {targeted:.1f} ms ({full / targeted:.1f}x), same fields: {same}")
+
+    page = linkedin[0]
+    inline = asyncio.run(max_loop_lag(lambda: tool._parse(page, ""), off_loop=False))
+    pooled = asyncio.run(max_loop_lag(lambda: tool._parse(page, ""), off_loop=True))
+    print(f"\nEvent loop stall while parsing linkedin[0]: inline {inline:.1f} ms, parse pool {pooled:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,31 +1,116 @@
 from dotenv import load_dotenv
 load_dotenv()
 
-from fastapi import FastAPI
+import json
+import os
+from typing import Optional
+from fastapi import FastAPI, Header, HTTPException
+from fastapi.encoders import jsonable_encoder
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from schemas import SearchQuery, FinalProfile, Candidate, ShallowResponse, DeepResponse, PlanResponse
-from tools.espy.client import EspyClient
+from fastapi.responses import FileResponse, StreamingResponse
+from schemas import SearchQuery, SearchBatchRequest, FinalProfile, Candidate, ShallowResponse, DeepResponse, PlanResponse
 from services.orchestrator import SearchOrchestrator
 from services.planner import generate_plan
 from services.executor import execute_plan_scrape_only
+from services.deadline import request_deadline
+from services.jobs import JobManager
+from services.circuit import breaker_stats
+from services import http
 
 app = FastAPI()
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 orchestrator = SearchOrchestrator()
+jobs = JobManager()
+
+@app.on_event("startup")
+async def open_http_client():
+    # One pooled client for every tool and service call made by this worker
+    await http.startup()
+
+@app.on_event("shutdown")
+async def close_http_client():
+    await http.aclose()
+
+def _use_cache(cache_control: Optional[str]) -> bool:
+    return "no-cache" not in (cache_control or "").lower()
 
 @app.get("/")
 async def root():
     return FileResponse("static/index.html")
 
 @app.post("/search", response_model=ShallowResponse)
-async def search(query: SearchQuery):
-    return await orchestrator.perform_shallow_search(query)
+async def search(query: SearchQuery, x_request_deadline_ms: Optional[int] = Header(default=None), cache_control: Optional[str] = Header(default=None)):
+    use_cache = _use_cache(cache_control)
+    with request_deadline(x_request_deadline_ms), orchestrator.tool_registry.bypass_cache(not use_cache):
+        return await orchestrator.perform_shallow_search(query, use_cache=use_cache)
+
+@app.post("/search/stream")
+async def search_stream(query: SearchQuery, x_request_deadline_ms: Optional[int] = Header(default=None)):
+    async def _ndjson():
+        # Streamed after the handler returns, so the deadline is applied inside the generator
+        with request_deadline(x_request_deadline_ms):
+            async for event in orchestrator.stream_shallow_search(query):
+                yield json.dumps(jsonable_encoder(event), default=str) + "\n"
+    return StreamingResponse(_ndjson(), media_type="application/x-ndjson")
+
+@app.post("/search/batch")
+async def search_batch(batch: SearchBatchRequest, x_request_deadline_ms: Optional[int] = Header(default=None)):
+    max_queries = int(os.getenv("BATCH_SEARCH_MAX_QUERIES", "500"))
+    if len(batch.queries) > max_queries:
+        raise HTTPException(status_code=413, detail=f"Batch exceeds {max_queries} queries")
+    async def _ndjson():
+        with request_deadline(x_request_deadline_ms):
+            async for item in orchestrator.stream_batch_search(batch.queries):
+                yield json.dumps(jsonable_encoder(item), default=str) + "\n"
+    return StreamingResponse(_ndjson(), media_type="application/x-ndjson")
 
 @app.post("/profile/enrich", response_model=DeepResponse)
-async def enrich(candidate: Candidate):
-    return await orchestrator.perform_deep_search(candidate)
+async def enrich(candidate: Candidate, session_id: Optional[str] = None, x_request_deadline_ms: Optional[int] = Header(default=None), cache_control: Optional[str] = Header(default=None)):
+    use_cache = _use_cache(cache_control)
+    with request_deadline(x_request_deadline_ms), orchestrator.tool_registry.bypass_cache(not use_cache):
+        return await orchestrator.perform_deep_search(candidate, use_cache=use_cache, session_id=session_id)
+
+@app.post("/profile/enrich/jobs", status_code=202)
+async def enrich_job(candidate: Candidate, session_id: Optional[str] = None, x_request_deadline_ms: Optional[int] = Header(default=None), cache_control: Optional[str] = Header(default=None)):
+    use_cache = _use_cache(cache_control)
+    # The job task inherits the deadline and cache bypass set here
+    with request_deadline(x_request_deadline_ms), orchestrator.tool_registry.bypass_cache(not use_cache):
+        job = jobs.submit("enrich", lambda: orchestrator.stream_deep_search(candidate, use_cache=use_cache, session_id=session_id))
+    return {"job_id": job.id, "status": job.status}
+
+@app.get("/jobs/{job_id}")
+async def job_status(job_id: str):
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return jsonable_encoder(job.snapshot())
+
+@app.get("/jobs/{job_id}/events")
+async def job_events(job_id: str):
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    async def _ndjson():
+        async for event in jobs.events(job):
+            yield json.dumps(jsonable_encoder(event), default=str) + "\n"
+    return StreamingResponse(_ndjson(), media_type="application/x-ndjson")
+
+@app.get("/cache/stats")
+async def cache_stats():
+    return orchestrator.cache_stats()
+
+@app.get("/status/limits")
+async def limit_stats():
+    return orchestrator.tool_registry.limit_stats()
+
+@app.get("/status/breakers")
+async def breakers():
+    return breaker_stats()
+
+@app.get("/status/tools")
+async def tool_stats():
+    return orchestrator.tool_registry.stats.snapshot()
 
 @app.post("/plan/search", response_model=PlanResponse)
 async def plan_search(query: SearchQuery):
@@ -41,11 +126,13 @@ async def plan_enrich(candidate: Candidate):
 async def execute_plan(plan: PlanResponse):
     return await execute_plan_scrape_only(plan)
 
-if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
-
 @app.get("/espy/poll/{request_id}")
 async def poll_espy(request_id: int):
+    # Imported here so workers don't load the ESPY client unless this endpoint is used
+    from tools.espy.client import EspyClient
     client = EspyClient()
-    return await client.poll_request(request_id)
\ No newline at end of file
+    return await client.poll_request(request_id)
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -26,6 +26,9 @@ class SearchQuery(BaseModel):
     location: Optional[str] = None
     free_text_context: Optional[str] = None
 
+class SearchBatchRequest(BaseModel):
+    queries: List[SearchQuery]
+
 class Candidate(BaseModel):
     name: Optional[str] = None
     email: Optional[str] = None
@@ -92,10 +95,12 @@ class FinalProfile(BaseModel):
 class ShallowResponse(BaseModel):
     candidates: List[Candidate]
     raw: List[Dict]
+    session_id: Optional[str] = None
 
 class DeepResponse(BaseModel):
     profile: FinalProfile
     raw: List[Dict]
+    degraded: bool = False
 
 class PlanStep(BaseModel):
     tool: str
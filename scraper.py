@@ -1,25 +1,73 @@
-import requests
+import os
+import re
+from typing import Any, Dict, List
+from urllib.parse import urlparse
 from bs4 import BeautifulSoup
 from schemas import ProfileData
+from services.cache import build_cache
+from services.http import error_fields, get_client
+from services.parsing import make_soup, parse_off_loop, strainer
+from services.singleflight import SingleFlight
 
-def scrape_github_profile(username: str) -> ProfileData:
+# github.com/<username> is fetched and parsed once and serves both the GitHub and GitHub-Extras
+# evidence: concurrent callers share the request, later ones the parsed result for a short TTL
+_profiles = build_cache("github_profiles", "GITHUB_PROFILE_CACHE", default_max_entries=512)
+_inflight = SingleFlight()
+# Everything the selectors below read: links, the bio, itemprop fields and data-test-selector blocks
+_PROFILE_PARTS = strainer(tags=("a",), attrs=("itemprop", "data-bio-text", "data-test-selector"))
+
+
+async def fetch_github_profile(username: str) -> Dict[str, Any]:
+    # {"profile": ProfileData fields, "extras": GitHub-Extras fields}, {"not_found": True} for a 404,
+    # or {"error", "transient"}; only parsed profiles are cached
+    key = username.strip().lower()
+    cached = _profiles.get(key)
+    if cached is not None:
+        return cached
+    return await _inflight.do(key, lambda: _fetch_and_parse(username, key))
+
+
+async def _fetch_and_parse(username: str, key: str) -> Dict[str, Any]:
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
     }
-    
+    timeout = float(os.getenv("GITHUB_PROFILE_TIMEOUT_S", os.getenv("GITHUB_EXTRAS_TIMEOUT", "10")))
     try:
-        response = requests.get(f'https://github.com/{username}', headers=headers, timeout=10)
+        response = await get_client().get(f'https://github.com/{username}', headers=headers, timeout=timeout)
+        if response.status_code == 404:
+            return {"not_found": True}
         response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
+    except Exception as e:
+        return error_fields(e)
+
+    parsed = await parse_off_loop(parse_github_page, response.content, username)
+    ttl_s = float(os.getenv("GITHUB_PROFILE_CACHE_TTL_S", "300"))
+    if ttl_s > 0:
+        _profiles.set(key, parsed, ttl_s)
+    return parsed
+
+
+def parse_github_page(content: bytes, username: str) -> Dict[str, Any]:
+    soup = make_soup(content, parse_only=_PROFILE_PARTS)
+    return {"profile": _parse_profile(soup).model_dump(), "extras": _parse_extras(soup, username)}
+
+
+async def scrape_github_profile(username: str) -> ProfileData:
+    parsed = await fetch_github_profile(username)
+    if parsed.get("error") or parsed.get("not_found"):
+        return ProfileData()
+    return ProfileData(**parsed["profile"])
+
+
+def _parse_profile(soup: BeautifulSoup) -> ProfileData:
+    try:
         name_elem = soup.select_one('[itemprop="name"]')
         bio_elem = soup.select_one('[data-bio-text]')
         location_elem = soup.select_one('[itemprop="homeLocation"]')
-        
+
         followers_elem = soup.select_one('a[href$="/followers"] .text-bold')
         following_elem = soup.select_one('a[href$="/following"] .text-bold')
-        
+
         return ProfileData(
             name=name_elem.get_text(strip=True) if name_elem else None,
             bio=bio_elem.get_text(strip=True) if bio_elem else None,
@@ -27,6 +75,98 @@ def scrape_github_profile(username: str) -> ProfileData:
             followers=int(followers_elem.get_text().replace(',', '')) if followers_elem else None,
             following=int(following_elem.get_text().replace(',', '')) if following_elem else None
         )
-    
+
+    except Exception:
+        return ProfileData()
+
+
+def _parse_extras(soup: BeautifulSoup, username: str) -> Dict[str, Any]:
+    website = _get_website(soup)
+    twitter = _get_social(soup, ["twitter.com", "x.com"]) or _handle_from_bio(soup)
+    return {
+        "username": username,
+        "website": website,
+        "domain": _domain_from_url(website) if website else None,
+        "company": _text(soup.select_one('[itemprop="worksFor"]')),
+        "location": _text(soup.select_one('[itemprop="homeLocation"]')),
+        "email": _get_email(soup),
+        "twitter": twitter,
+        "twitter_url": _social_url(twitter),
+        "linkedin": _get_social(soup, ["linkedin.com"]),
+        "organizations": _get_orgs(soup),
+    }
+
+
+def _text(el) -> str:
+    return el.get_text(strip=True) if el else ""
+
+
+def _get_website(soup) -> str:
+    el = soup.select_one('[data-test-selector="profile-website-url"]')
+    if el and el.get("href"):
+        return el.get("href").strip()
+    link = soup.select_one('[data-bio-text] a[href]')
+    if link and isinstance(link.get("href"), str):
+        href = link.get("href")
+        if any(k in href for k in ["http://", "https://", ".", "blog", "portfolio", "medium.com", "dev.to"]):
+            return href.strip()
+    return ""
+
+
+def _get_email(soup) -> str:
+    el = soup.select_one('[itemprop="email"]')
+    if el:
+        return _text(el)
+    bio = soup.select_one('[data-bio-text]')
+    if bio:
+        m = re.search(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", bio.get_text())
+        if m:
+            return m.group(0)
+    return ""
+
+
+def _get_social(soup, hosts: List[str]) -> str:
+    for a in soup.select('[data-bio-text] a[href], a[href]'):
+        href = a.get("href") or ""
+        if any(h in href for h in hosts):
+            return href.strip()
+    return ""
+
+
+def _social_url(value: str) -> str:
+    # Bio handles ("@name") become profile URLs so X-Verify can take them like a finder result
+    if value.startswith("@"):
+        return f"https://x.com/{value[1:]}"
+    return value
+
+
+def _handle_from_bio(soup) -> str:
+    bio = soup.select_one('[data-bio-text]')
+    if not bio:
+        return ""
+    m = re.search(r"@([A-Za-z0-9_]{1,30})\b", bio.get_text())
+    if m:
+        return "@" + m.group(1)
+    return ""
+
+
+def _get_orgs(soup) -> List[str]:
+    out: List[str] = []
+    for a in soup.select('[data-test-selector="profile-orgs"] a[href]'):
+        href = a.get("href") or ""
+        if href.startswith("/"):
+            slug = href.strip("/")
+            if slug and slug not in out:
+                out.append(slug)
+    return out
+
+
+def _domain_from_url(url_str: str) -> str:
+    try:
+        p = urlparse(url_str)
+        host = p.netloc or ""
+        if host.startswith("www."):
+            host = host[4:]
+        return host
     except Exception:
-        return ProfileData()
\ No newline at end of file
+        return ""
@@ -1,15 +1,17 @@
 import json
+from typing import Tuple
 from dotenv import load_dotenv
 from schemas import SearchQuery, FinalProfile
-from services.llm import get_gemini_model
+from services.llm import get_gemini_model, generate_content
 
 load_dotenv()
 
 
-async def parse_user_request(text: str) -> SearchQuery:
+async def extract_query_and_hint(text: str) -> Tuple[SearchQuery, str]:
+    # One flash call returns both the structured SearchQuery fields and the search hint
     model = get_gemini_model(model_name="gemini-2.5-flash")
-    if model is None:
-        return SearchQuery()
+    if model is None or not text:
+        return SearchQuery(), ""
     prompt = f"""
     You are a highly intelligent data extraction API. Your sole purpose is to convert a user's free-text query into a structured JSON object.
 
@@ -25,11 +27,15 @@ async def parse_user_request(text: str) -> SearchQuery:
         "phone": "string",
         "username": "string",
         "location": "string",
-        "free_text_context": "string"
+        "free_text_context": "string",
+        "search_hint": "string"
     }}
 
+    "search_hint" is one short hint (<=50 chars) from the text that can uniquely help find the person's public profiles.
+    Prefer proper nouns like employer, university, project, or certification. Avoid generic roles or buzzwords.
+
     Example:
-    User Query: "Can you find the guy named John Doe? I heard he goes by @johndoeonline and he's a senior engineer working on AI stuff, maybe based out of San Francisco."
+    User Query: "Can you find the guy named John Doe? I heard he goes by @johndoeonline and he's a senior engineer working on AI stuff at OpenAI, maybe based out of San Francisco."
     JSON Output:
     {{
         "name": "John Doe",
@@ -37,28 +43,44 @@ async def parse_user_request(text: str) -> SearchQuery:
         "phone": null,
         "username": "@johndoeonline",
         "location": "San Francisco",
-        "free_text_context": "senior engineer working on AI stuff"
+        "free_text_context": "senior engineer working on AI stuff at OpenAI",
+        "search_hint": "OpenAI"
     }}
 
     Now, parse the following user query:
 
     User Query: "{text}"
     """
-    
+
     try:
-        response = await model.generate_content_async(
+        response = await generate_content(
+            model,
             prompt,
             generation_config={"response_mime_type": "application/json"}
         )
         print("----------- EXTRACTOR LLM RESPONSE TEXT -----------")
         print(response.text)
         print("-------------------------------------------------")
-        return SearchQuery.model_validate_json(response.text)
+        data = json.loads(response.text)
+        if not isinstance(data, dict):
+            return SearchQuery(), ""
+        hint = str(data.pop("search_hint", None) or "").strip().strip("\"'")[:50]
+        try:
+            query = SearchQuery.model_validate(data)
+        except Exception:
+            query = SearchQuery()
+        return query, hint
     except Exception:
-        return SearchQuery()
+        return SearchQuery(), ""
+
+
+async def parse_user_request(text: str) -> SearchQuery:
+    query, _ = await extract_query_and_hint(text)
+    return query
 
 
-async def synthesize_profile(data_list: list) -> FinalProfile:
+async def synthesize_profile(data_list: list) -> Tuple[FinalProfile, bool]:
+    # Returns the profile and whether it is the heuristic fallback after the model failed or timed out
     import os
     model_name = os.getenv("GEMINI_SYNTHESIS_MODEL", "gemini-2.5-pro")
     model = get_gemini_model(model_name=model_name, tools={
@@ -93,7 +115,7 @@ async def synthesize_profile(data_list: list) -> FinalProfile:
                 locations.extend([str(x) for x in loc])
         full_name = name or "Unknown"
         summary = "Consolidated profile from available sources."
-        return FinalProfile(full_name=full_name, summary=summary, locations=list(dict.fromkeys(locations)), employment_history=[])
+        return FinalProfile(full_name=full_name, summary=summary, locations=list(dict.fromkeys(locations)), employment_history=[]), False
     prompt = f"""
 You are an intelligence analyst. Produce a single coherent person profile from structured tool outputs.
 
@@ -108,20 +130,21 @@ Rules:
 - After reasoning, you MUST call submit_final_profile with fields: full_name, summary, locations, employment_history.
 
 Inputs (JSON):
-{json.dumps(data_list, indent=2)}
+{json.dumps(data_list, separators=(',', ':'), default=str)}
 """
 
     # Try up to 2 attempts, then fallback to heuristic synthesis
     last_err = None
     for _ in range(2):
         try:
-            response = await model.generate_content_async(prompt)
+            # The answer is read from a function call, which the LLM cache does not keep
+            response = await generate_content(model, prompt, cache=False)
             # Defensive parse: prefer function_call, else parse JSON in text
             try:
                 function_call = response.candidates[0].content.parts[0].function_call
                 if function_call and getattr(function_call, 'name', '') == "submit_final_profile":
                     args = {key: value for key, value in function_call.args.items()}
-                    return FinalProfile.model_validate(args)
+                    return FinalProfile.model_validate(args), False
             except Exception:
                 pass
             # Fallback: attempt JSON parse of response.text
@@ -133,7 +156,7 @@ Inputs (JSON):
                         "summary": text_obj.get("summary") or "Consolidated profile from available sources.",
                         "locations": text_obj.get("locations") or [],
                         "employment_history": text_obj.get("employment_history") or [],
-                    })
+                    }), False
             except Exception:
                 pass
             raise ValueError("Model did not return expected tool call or JSON.")
@@ -155,23 +178,10 @@ Inputs (JSON):
             locations.extend([str(x) for x in loc])
     full_name = name or "Unknown"
     summary = "Consolidated profile from available sources."
-    return FinalProfile(full_name=full_name, summary=summary, locations=list(dict.fromkeys(locations)), employment_history=[])
+    return FinalProfile(full_name=full_name, summary=summary, locations=list(dict.fromkeys(locations)), employment_history=[]), True
 
 
 async def generate_search_hint(context: str) -> str:
-    model = get_gemini_model(model_name="gemini-2.5-flash")
-    if model is None or not context:
-        return ""
-    prompt = f"""
-You extract one short hint (<=50 chars) from the text that can uniquely help find a person's public profiles. Prefer proper nouns like employer, university, project, or certification. Avoid generic roles or buzzwords. Return only the hint string, no quotes, no extra text.
-
-Text:\n{context}
-"""
-    try:
-        resp = await model.generate_content_async(prompt)
-        hint = (resp.text or "").strip().strip("\"'")
-        if len(hint) > 50:
-            hint = hint[:50]
-        return hint
-    except Exception:
-        return ""
+    # Same call (and LLM cache entry) as parse_user_request for the same text
+    _, hint = await extract_query_and_hint(context)
+    return hint
@@ -0,0 +1,56 @@
+import asyncio
+import contextlib
+import time
+from typing import Any, AsyncIterator, Dict, Optional
+
+
+class BulkheadFull(Exception):
+    pass
+
+
+class Bulkhead:
+    # Caps concurrent executions (max_inflight) and callers waiting for a slot (max_queue); 0 = unbounded
+    def __init__(self, name: str, max_inflight: int = 0, max_queue: int = 0):
+        self.name = name
+        self.max_inflight = max(0, max_inflight)
+        self.max_queue = max(0, max_queue)
+        self._sem: Optional[asyncio.Semaphore] = asyncio.Semaphore(self.max_inflight) if self.max_inflight else None
+        self.inflight = 0
+        self.waiting = 0
+        self.rejected = 0
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[float]:
+        # Yields the seconds spent waiting for the slot; raises BulkheadFull instead of queueing past max_queue
+        if self._sem is None:
+            self.inflight += 1
+            try:
+                yield 0.0
+            finally:
+                self.inflight -= 1
+            return
+        if self._sem.locked() and self.max_queue and self.waiting >= self.max_queue:
+            self.rejected += 1
+            raise BulkheadFull(self.name)
+        t0 = time.monotonic()
+        self.waiting += 1
+        try:
+            await self._sem.acquire()
+        finally:
+            self.waiting -= 1
+        waited = time.monotonic() - t0
+        self.inflight += 1
+        try:
+            yield waited
+        finally:
+            self.inflight -= 1
+            self._sem.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_inflight": self.max_inflight,
+            "max_queue": self.max_queue,
+            "inflight": self.inflight,
+            "waiting": self.waiting,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,143 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+class MemoryCache:
+    def __init__(self, max_entries: int = 1024):
+        self._max = max(1, max_entries)
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Tuple[bool, Any, float]:
+        rec = self._data.get(key)
+        if rec is None:
+            return False, None, 0.0
+        expires_at, value = rec
+        if time.time() >= expires_at:
+            self._data.pop(key, None)
+            return False, None, 0.0
+        self._data.move_to_end(key)
+        return True, value, expires_at
+
+    def set(self, key: str, value: Any, expires_at: float) -> None:
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._max:
+            self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SqliteCache:
+    # Values are stored as JSON, so only JSON-serializable values survive a restart
+    def __init__(self, path: str, table: str = "cache"):
+        self._table = table
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute(f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)")
+            self._conn.commit()
+
+    def get(self, key: str) -> Tuple[bool, Any, float]:
+        with self._lock:
+            row = self._conn.execute(f"SELECT value, expires_at FROM {self._table} WHERE key = ?", (key,)).fetchone()
+        if not row:
+            return False, None, 0.0
+        value, expires_at = row
+        if time.time() >= expires_at:
+            self.delete(key)
+            return False, None, 0.0
+        return True, json.loads(value), expires_at
+
+    def set(self, key: str, value: Any, expires_at: float) -> None:
+        blob = json.dumps(value, default=str)
+        with self._lock:
+            self._conn.execute(f"INSERT OR REPLACE INTO {self._table} (key, value, expires_at) VALUES (?, ?, ?)", (key, blob, expires_at))
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self._table} WHERE key = ?", (key,))
+            self._conn.commit()
+
+
+class Cache:
+    # In-memory LRU tier with TTLs, optionally backed by an on-disk SQLite tier
+    def __init__(self, name: str, max_entries: int = 1024, disk_path: Optional[str] = None):
+        self.name = name
+        self._memory = MemoryCache(max_entries)
+        self._disk: Optional[SqliteCache] = None
+        self._log = logging.getLogger(__name__)
+        if disk_path:
+            try:
+                self._disk = SqliteCache(disk_path, table=name.replace("-", "_"))
+            except Exception:
+                self._log.exception("Cache %s: disk tier unavailable at %s", name, disk_path)
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.sets = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        found, value, _ = self._memory.get(key)
+        if found:
+            self.hits += 1
+            return value
+        if self._disk is not None:
+            try:
+                found, value, expires_at = self._disk.get(key)
+            except Exception:
+                self._log.exception("Cache %s: disk read failed", self.name)
+                found = False
+            if found:
+                self.hits += 1
+                self.disk_hits += 1
+                self._memory.set(key, value, expires_at)
+                return value
+        self.misses += 1
+        return None
+
+    def set(self, key: str, value: Any, ttl_s: float) -> None:
+        if ttl_s <= 0:
+            return
+        expires_at = time.time() + ttl_s
+        self._memory.set(key, value, expires_at)
+        self.sets += 1
+        if self._disk is not None:
+            try:
+                self._disk.set(key, value, expires_at)
+            except Exception:
+                self._log.exception("Cache %s: disk write failed", self.name)
+
+    def delete(self, key: str) -> None:
+        self._memory.delete(key)
+        if self._disk is not None:
+            self._disk.delete(key)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._memory),
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "sets": self.sets,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "disk": self._disk is not None,
+        }
+
+
+def build_cache(name: str, env_prefix: str, default_max_entries: int = 1024) -> Cache:
+    # <PREFIX>_MAX_ENTRIES bounds the memory tier; <PREFIX>_DISK_PATH enables the SQLite tier
+    max_entries = int(os.getenv(f"{env_prefix}_MAX_ENTRIES", str(default_max_entries)))
+    disk_path = os.getenv(f"{env_prefix}_DISK_PATH") or None
+    return Cache(name, max_entries=max_entries, disk_path=disk_path)
@@ -0,0 +1,117 @@
+import asyncio
+import logging
+import os
+import re
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from .policy import is_transient_error
+
+T = TypeVar("T")
+
+
+class CircuitOpen(Exception):
+    pass
+
+
+def is_provider_failure(error: BaseException) -> bool:
+    # Timeouts, connection errors and 429/5xx count against the provider; bad input (4xx, parse errors) does not
+    return is_transient_error(error)
+
+
+class CircuitBreaker:
+    # closed -> open after `failure_threshold` consecutive failures; after `cooldown_s` one probe call
+    # is let through (half-open): success closes the circuit, failure re-opens it for another cool-down
+    def __init__(self, name: str, failure_threshold: int = 5, cooldown_s: float = 30.0):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown_s = max(0.0, cooldown_s)
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.rejected = 0
+        self._probing = False
+        self._log = logging.getLogger(__name__)
+
+    def _admit(self) -> bool:
+        # Returns True when this call is the half-open probe
+        if self.state == "open":
+            if time.monotonic() - (self.opened_at or 0.0) < self.cooldown_s:
+                self.rejected += 1
+                raise CircuitOpen(self.name)
+            self.state = "half_open"
+            self._log.info("Circuit %s half-open, probing", self.name)
+        if self.state == "half_open":
+            if self._probing:
+                self.rejected += 1
+                raise CircuitOpen(self.name)
+            self._probing = True
+            return True
+        return False
+
+    def _record(self, failed: bool, probe: bool) -> None:
+        if probe:
+            self._probing = False
+        elif self.state != "closed":
+            # Calls admitted before the circuit opened finish late; only the probe decides open vs closed
+            return
+        if not failed:
+            if self.state != "closed":
+                self._log.info("Circuit %s closed", self.name)
+            self.state = "closed"
+            self.failures = 0
+            return
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            if self.state != "open":
+                self._log.warning("Circuit %s open after %d failures", self.name, self.failures)
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+    async def call(self, fn: Callable[[], Awaitable[T]], failed: Callable[[T], bool] = lambda _: False) -> T:
+        # Raises CircuitOpen without calling fn while the circuit is open; `failed` classifies returned values
+        probe = self._admit()
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            # A cancelled probe says nothing about the provider; let the next caller probe
+            if probe:
+                self._probing = False
+            raise
+        except Exception as e:
+            self._record(is_provider_failure(e), probe)
+            raise
+        self._record(failed(result), probe)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        retry_in = None
+        if self.state == "open" and self.opened_at is not None:
+            retry_in = round(max(0.0, self.cooldown_s - (time.monotonic() - self.opened_at)), 1)
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "failure_threshold": self.failure_threshold,
+            "cooldown_s": self.cooldown_s,
+            "retry_in_s": retry_in,
+            "rejected": self.rejected,
+        }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(provider: str) -> CircuitBreaker:
+    # One breaker per provider, shared process-wide; CIRCUIT_<PROVIDER>_FAILURES / _COOLDOWN_S override the defaults
+    breaker = _breakers.get(provider)
+    if breaker is None:
+        env_name = re.sub(r"[^A-Z0-9]+", "_", provider.upper())
+        threshold = os.getenv(f"CIRCUIT_{env_name}_FAILURES", os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+        cooldown = os.getenv(f"CIRCUIT_{env_name}_COOLDOWN_S", os.getenv("CIRCUIT_COOLDOWN_S", "30"))
+        breaker = CircuitBreaker(provider, int(threshold), float(cooldown))
+        _breakers[provider] = breaker
+    return breaker
+
+
+def breaker_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: b.stats() for name, b in sorted(_breakers.items())}
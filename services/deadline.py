@@ -0,0 +1,60 @@
+import asyncio
+import contextlib
+import os
+import time
+from contextvars import ContextVar
+from typing import Any, Awaitable, Iterator, Optional
+
+
+class Deadline:
+    def __init__(self, expires_at: float):
+        self.expires_at = expires_at
+
+    @classmethod
+    def after_ms(cls, budget_ms: int) -> "Deadline":
+        return cls(time.monotonic() + max(0, budget_ms) / 1000.0)
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+    def reserve(self, seconds: float) -> "Deadline":
+        # Earlier deadline that keeps `seconds` (at most half the remaining budget) for later work
+        keep = min(max(0.0, seconds), self.remaining() / 2)
+        return Deadline(self.expires_at - keep)
+
+
+_current: ContextVar[Optional[Deadline]] = ContextVar("request_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _current.get()
+
+
+@contextlib.contextmanager
+def use_deadline(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+@contextlib.contextmanager
+def request_deadline(budget_ms: Optional[int] = None) -> Iterator[Optional[Deadline]]:
+    # Explicit per-request budget wins; REQUEST_DEADLINE_MS (0 = unbounded) is the default
+    if budget_ms is None:
+        budget_ms = int(os.getenv("REQUEST_DEADLINE_MS", "0"))
+    deadline = Deadline.after_ms(budget_ms) if budget_ms and budget_ms > 0 else None
+    with use_deadline(deadline) as d:
+        yield d
+
+
+async def within_deadline(aw: Awaitable[Any]) -> Any:
+    # Raises asyncio.TimeoutError if the current request deadline passes first
+    deadline = current_deadline()
+    if deadline is None:
+        return await aw
+    return await asyncio.wait_for(aw, timeout=deadline.remaining())
@@ -0,0 +1,128 @@
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+# Conflict resolution order shared by synthesis and the judge; compaction truncates from the bottom up
+SOURCE_PRIORITY = ["LinkedIn-Verify", "ESPY", "GitHub", "Numverify", "OpenCage", "Holehe-Modules", "GHunt", "X-Verify", "LinkedIn-Finder", "X-Finder"]
+# Bookkeeping and bulky payload keys no LLM step reads (markup, screenshots, job ids, timings, provenance)
+_NOISE_KEYS = frozenset({
+    "html", "raw_html", "rawHtml", "screenshot", "links", "job_id", "jobId", "status", "schema_version",
+    "command_used", "runtime_ms", "duration_ms", "coverage", "statuses", "module_path", "cached", "note",
+})
+# Per-string character caps and per-list item caps, applied in order until the evidence fits the budget
+_TEXT_CAPS = (4000, 1000, 300, 80)
+_LIST_CAPS = (50, 20, 8, 3)
+# Text at least this long that another source already reported is sent only once
+_DEDUPE_MIN_CHARS = 40
+_log = logging.getLogger(__name__)
+
+
+def estimate_tokens(value: Any) -> int:
+    # ~4 characters per token for the compact JSON the prompts embed
+    return len(json.dumps(value, separators=(",", ":"), default=str)) // 4
+
+
+def compact_evidence(results: List[Dict[str, Any]], max_tokens: Optional[int] = None) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    # Returns a trimmed copy of `results` as [{"source", "raw_data"}] plus before/after token estimates;
+    # `results` itself is left untouched for the API response
+    budget = max_tokens if max_tokens is not None else int(os.getenv("EVIDENCE_TOKEN_BUDGET", "12000"))
+    before = estimate_tokens(results)
+    items = []
+    for item in results:
+        if _failed(item):
+            continue
+        raw = _strip(item.get("raw_data"))
+        if raw is not None:
+            items.append({"source": item.get("source") or "", "raw_data": raw})
+    items.sort(key=lambda it: _rank(it["source"]))
+    _dedupe(items)
+
+    if budget > 0:
+        # Lowest-priority sources are cut first at each cap level before higher ones are touched
+        for text_cap, list_cap in zip(_TEXT_CAPS, _LIST_CAPS):
+            for item in reversed(items):
+                if estimate_tokens(items) <= budget:
+                    break
+                item["raw_data"] = _truncate(item["raw_data"], text_cap, list_cap)
+        while len(items) > 1 and estimate_tokens(items) > budget:
+            items.pop()
+
+    stats = {"before_tokens": before, "after_tokens": estimate_tokens(items), "sources": len(items), "dropped": len(results) - len(items)}
+    _log.info("Evidence compacted %s -> %s tokens (%s sources kept, %s dropped)", stats["before_tokens"], stats["after_tokens"], stats["sources"], stats["dropped"])
+    return items, stats
+
+
+def _rank(source: str) -> int:
+    # "candidate"/"user_input" first, then SOURCE_PRIORITY (ESPY-* match "ESPY"), then everything else
+    if source in ("candidate", "user_input"):
+        return -1
+    for i, name in enumerate(SOURCE_PRIORITY):
+        if source == name or source.startswith(name + "-"):
+            return i
+    return len(SOURCE_PRIORITY)
+
+
+def _failed(item: Dict[str, Any]) -> bool:
+    raw = item.get("raw_data")
+    return bool(item.get("error")) or item.get("source") == "error" or (isinstance(raw, dict) and bool(raw.get("error")))
+
+
+def _strip(value: Any) -> Any:
+    # Drops noise keys, failed sub-results and empty values; returns None when nothing is left
+    if isinstance(value, dict):
+        if value.get("error") or value.get("ok") is False:
+            return None
+        out = {}
+        for k, v in value.items():
+            if k in _NOISE_KEYS:
+                continue
+            v = _strip(v)
+            if v is not None:
+                out[k] = v
+        return out or None
+    if isinstance(value, list):
+        out_list = [v for v in (_strip(v) for v in value) if v is not None]
+        return out_list or None
+    if isinstance(value, str):
+        value = value.strip()
+        return value or None
+    return value
+
+
+def _dedupe(items: List[Dict[str, Any]]) -> None:
+    # Items are in priority order, so the best source keeps the text and later ones get a reference
+    seen: Dict[str, str] = {}
+
+    def walk(value: Any, source: str) -> Any:
+        if isinstance(value, dict):
+            return {k: walk(v, source) for k, v in value.items()}
+        if isinstance(value, list):
+            return [walk(v, source) for v in value]
+        if isinstance(value, str) and len(value) >= _DEDUPE_MIN_CHARS:
+            key = " ".join(value.lower().split())
+            if key in seen:
+                return f"[same as {seen[key]}]"
+            seen[key] = source
+        return value
+
+    for item in items:
+        item["raw_data"] = walk(item["raw_data"], item["source"])
+
+
+def _truncate(value: Any, text_cap: int, list_cap: int) -> Any:
+    if isinstance(value, dict):
+        return {k: _truncate(v, text_cap, list_cap) for k, v in value.items()}
+    if isinstance(value, list):
+        hidden = 0
+        if value and isinstance(value[-1], str) and value[-1].startswith("[+") and value[-1].endswith(" more]"):
+            # Already cut at a looser cap; carry the earlier count forward
+            hidden, value = int(value[-1][2:-6]), value[:-1]
+        kept = [_truncate(v, text_cap, list_cap) for v in value[:list_cap]]
+        hidden += max(0, len(value) - list_cap)
+        if hidden:
+            kept.append(f"[+{hidden} more]")
+        return kept
+    if isinstance(value, str) and len(value) > text_cap:
+        return value[:text_cap] + "…"
+    return value
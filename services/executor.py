@@ -2,7 +2,6 @@ import os
 from typing import Dict, Any, List
 
 from schemas import PlanResponse
-from tools.hyperbrowser.scrape import HyperbrowserScrapeTool
 
 _ALLOWED_HOSTS = set(
     (os.getenv("SCRAPE_ALLOWLIST_HOSTS", "github.com,x.com,medium.com,dev.to").split(","))
@@ -41,6 +40,7 @@ async def execute_plan_scrape_only(plan: PlanResponse) -> List[Dict[str, Any]]:
     per_url_timeout_ms = int(os.getenv("HYPERBROWSER_SCRAPE_TIMEOUT_MS", os.getenv("HYPERBROWSER_TIMEOUT_MS", "30000")))
 
     results: List[Dict[str, Any]] = []
+    from tools.hyperbrowser.scrape import HyperbrowserScrapeTool
     scrape_tool = HyperbrowserScrapeTool()
 
     for step in plan.steps:
@@ -1,6 +1,7 @@
 import os
 from typing import Dict, Any, Optional
-import httpx
+from .circuit import CircuitOpen, get_breaker
+from .http import get_client
 
 
 async def geocode_location(text: str, language: Optional[str] = None) -> Dict[str, Any]:
@@ -14,11 +15,16 @@ async def geocode_location(text: str, language: Optional[str] = None) -> Dict[st
     }
     if language:
         params["language"] = language
+
+    async def _fetch() -> Dict[str, Any]:
+        r = await get_client().get("https://api.opencagedata.com/geocode/v1/json", params=params, timeout=8)
+        r.raise_for_status()
+        return r.json()
+
     try:
-        async with httpx.AsyncClient(timeout=8) as client:
-            r = await client.get("https://api.opencagedata.com/geocode/v1/json", params=params)
-            r.raise_for_status()
-            data = r.json()
+        data = await get_breaker("opencage").call(_fetch)
+    except CircuitOpen:
+        return {"error": "circuit_open"}
     except Exception as e:
         return {"error": str(e)}
     results = data.get("results") or []
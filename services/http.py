@@ -0,0 +1,173 @@
+import asyncio
+import importlib.util
+import logging
+import os
+import socket
+import time
+from itertools import zip_longest
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+import httpcore
+import httpx
+
+from .policy import is_transient_error
+
+# All outbound HTTP goes through one pooled, non-blocking client (never `requests`, never a client per call).
+# The API opens it on startup and closes it on shutdown; scripts and tests get one lazily per event loop.
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_log = logging.getLogger(__name__)
+
+
+class _CachingResolver(httpcore.AsyncNetworkBackend):
+    # Resolves each host once per `ttl_s` instead of on every new connection. TLS still verifies
+    # against the request's hostname, since httpcore passes it separately from the dialled address.
+    def __init__(self, ttl_s: float):
+        self._backend = httpcore.AnyIOBackend()
+        self._ttl_s = ttl_s
+        self._cache: Dict[Tuple[str, int], Tuple[List[str], float]] = {}
+
+    async def _resolve(self, host: str, port: int) -> List[str]:
+        cached = self._cache.get((host, port))
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+        infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        # Every address, in resolver order with IPv6 and IPv4 interleaved (as happy eyeballs would try them)
+        v6 = [i[4][0] for i in infos if i[0] == socket.AF_INET6]
+        v4 = [i[4][0] for i in infos if i[0] != socket.AF_INET6]
+        first, second = (v6, v4) if infos[0][0] == socket.AF_INET6 else (v4, v6)
+        addresses: List[str] = []
+        for pair in zip_longest(first, second):
+            addresses.extend(a for a in pair if a and a not in addresses)
+        self._cache[(host, port)] = (addresses, time.monotonic() + self._ttl_s)
+        return addresses
+
+    async def connect_tcp(self, host: str, port: int, timeout: Optional[float] = None, local_address: Optional[str] = None, socket_options: Any = None) -> httpcore.AsyncNetworkStream:
+        error: Optional[Exception] = None
+        for address in await self._resolve(host, port):
+            try:
+                return await self._backend.connect_tcp(address, port, timeout=timeout, local_address=local_address, socket_options=socket_options)
+            except Exception as e:
+                error = e
+        # No address answered; they may have moved, so resolve again next time
+        self._cache.pop((host, port), None)
+        raise error or httpcore.ConnectError(f"no addresses for {host}")
+
+    async def connect_unix_socket(self, path: str, timeout: Optional[float] = None, socket_options: Any = None) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(path, timeout=timeout, socket_options=socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    def __init__(self, stream: Any, release: Callable[[], None]):
+        self._stream = stream
+        self._release: Optional[Callable[[], None]] = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class _PerHostLimit(httpx.AsyncBaseTransport):
+    # Caps concurrent requests per host (held until the response body is closed), so one slow provider
+    # cannot take every pooled connection
+    def __init__(self, transport: httpx.AsyncBaseTransport, per_host: int):
+        self._transport = transport
+        self._per_host = per_host
+        self._sems: Dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        sem = self._sems.get(request.url.host)
+        if sem is None:
+            sem = self._sems[request.url.host] = asyncio.Semaphore(self._per_host)
+        await sem.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            sem.release()
+            raise
+        response.stream = _ReleasingStream(response.stream, sem.release)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _use_http2() -> bool:
+    mode = os.getenv("HTTP_HTTP2", "auto").lower()
+    if mode == "auto":
+        return importlib.util.find_spec("h2") is not None
+    return mode == "true"
+
+
+def build_client() -> httpx.AsyncClient:
+    timeout = httpx.Timeout(
+        float(os.getenv("HTTP_TIMEOUT_S", "10")),
+        connect=float(os.getenv("HTTP_CONNECT_TIMEOUT_S", "5")),
+    )
+    limits = httpx.Limits(
+        max_connections=int(os.getenv("HTTP_MAX_CONNECTIONS", "200")),
+        max_keepalive_connections=int(os.getenv("HTTP_MAX_KEEPALIVE", "50")),
+        keepalive_expiry=float(os.getenv("HTTP_KEEPALIVE_EXPIRY_S", "60")),
+    )
+    http2 = _use_http2()
+    transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(limits=limits, http2=http2)
+    dns_ttl_s = float(os.getenv("HTTP_DNS_CACHE_TTL_S", "300"))
+    pool = getattr(transport, "_pool", None)
+    if dns_ttl_s > 0 and hasattr(pool, "_network_backend"):
+        # httpx has no public hook for the network backend; the pool's backend is swapped in place
+        pool._network_backend = _CachingResolver(dns_ttl_s)  # type: ignore[union-attr]
+    per_host = int(os.getenv("HTTP_MAX_PER_HOST", "20"))
+    if per_host > 0:
+        transport = _PerHostLimit(transport, per_host)
+    _log.info("HTTP client: http2=%s max_connections=%s per_host=%s dns_ttl_s=%s", http2, limits.max_connections, per_host, dns_ttl_s)
+    return httpx.AsyncClient(timeout=timeout, transport=transport, follow_redirects=True)
+
+
+def get_client() -> httpx.AsyncClient:
+    # The app-scoped client when running under the API, else one per event loop created on first use;
+    # per-call `timeout=` overrides the default
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = build_client()
+        _client_loop = loop
+    return _client
+
+
+def set_client(client: Optional[httpx.AsyncClient]) -> None:
+    # Install a pre-configured client for the running loop (None resets to the default on next use)
+    global _client, _client_loop
+    _client = client
+    _client_loop = asyncio.get_running_loop() if client is not None else None
+
+
+async def startup() -> None:
+    set_client(build_client())
+
+
+async def aclose() -> None:
+    global _client, _client_loop
+    client, _client, _client_loop = _client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+def error_message(error: BaseException) -> str:
+    # httpx timeouts often carry an empty message; keep the type so the error is never blank
+    return str(error) or type(error).__name__
+
+
+def error_fields(error: BaseException) -> Dict[str, Any]:
+    # raw_data fields for a failed call; retries and circuit breakers read "transient", never the message
+    return {"error": error_message(error), "transient": is_transient_error(error)}
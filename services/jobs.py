@@ -0,0 +1,113 @@
+import asyncio
+import logging
+import os
+import time
+import uuid
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+
+class Job:
+    def __init__(self, kind: str):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.status = "queued"
+        self.created_at = time.time()
+        self.updated_at = self.created_at
+        self.tools: Dict[str, str] = {}
+        self.raw: List[Dict[str, Any]] = []
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.events: List[Dict[str, Any]] = []
+        self._changed = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in {"done", "failed"}
+
+    def record(self, event: Dict[str, Any]) -> None:
+        kind = event.get("event")
+        data = event.get("data") or {}
+        if kind == "tool_started":
+            self.tools[data.get("tool") or "unknown"] = "running"
+        elif kind == "tool_result":
+            self.raw.append(data)
+            tool = (data.get("meta") or {}).get("tool")
+            if tool:
+                failed = data.get("error") or (data.get("raw_data") or {}).get("error")
+                self.tools[tool] = (data.get("raw_data") or {}).get("status") or ("error" if failed else "done")
+        elif kind == "result":
+            self.result = data
+        self.events.append(event)
+        self._touch()
+
+    def finish(self, error: Optional[str] = None) -> None:
+        self.error = error
+        self.status = "failed" if error else "done"
+        self.events.append({"event": "job", "data": {"status": self.status, "error": error}})
+        self._touch()
+
+    def _touch(self) -> None:
+        self.updated_at = time.time()
+        # Wake current subscribers, then arm a fresh event for the next change
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "tools": dict(self.tools),
+            "raw": list(self.raw),
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class JobManager:
+    def __init__(self) -> None:
+        self._jobs: Dict[str, Job] = {}
+        self._ttl_s = float(os.getenv("JOB_TTL_S", "3600"))
+        self._log = logging.getLogger(__name__)
+
+    def submit(self, kind: str, stream: Callable[[], AsyncIterator[Dict[str, Any]]]) -> Job:
+        self._prune()
+        job = Job(kind)
+        self._jobs[job.id] = job
+        job._task = asyncio.ensure_future(self._run(job, stream))
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    async def events(self, job: Job) -> AsyncIterator[Dict[str, Any]]:
+        # Replays the job's events from the start, then follows new ones until it finishes
+        sent = 0
+        while True:
+            changed = job._changed
+            while sent < len(job.events):
+                yield job.events[sent]
+                sent += 1
+            if job.finished:
+                return
+            await changed.wait()
+
+    async def _run(self, job: Job, stream: Callable[[], AsyncIterator[Dict[str, Any]]]) -> None:
+        job.status = "running"
+        job._touch()
+        try:
+            async for event in stream():
+                job.record(event)
+            job.finish()
+        except Exception as e:
+            self._log.exception("Job %s failed", job.id)
+            job.finish(error=str(e))
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self._ttl_s
+        for job_id, job in list(self._jobs.items()):
+            if job.finished and job.updated_at < cutoff:
+                self._jobs.pop(job_id, None)
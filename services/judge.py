@@ -1,7 +1,8 @@
 import os
 from typing import Dict, Any, List, Tuple
 from schemas import FinalProfile
-from services.llm import get_gemini_model
+from services.evidence import SOURCE_PRIORITY
+from services.llm import get_gemini_model, generate_content
 
 
 class ProfileJudge:
@@ -11,10 +12,10 @@ class ProfileJudge:
     async def judge(self, profile: FinalProfile, raw: List[Dict[str, Any]]) -> Dict[str, Any]:
         model = get_gemini_model(model_name=self.model_name)
         if model is None:
-            return self._fallback(profile, raw)
+            return self._fallback(profile, raw, degraded=False)
         prompt = self._build_prompt(profile, raw)
         try:
-            resp = await model.generate_content_async(prompt, generation_config={"response_mime_type": "application/json"})
+            resp = await generate_content(model, prompt, generation_config={"response_mime_type": "application/json"})
             data = self._safe_json(resp.text)
             if not isinstance(data, dict):
                 return self._fallback(profile, raw)
@@ -35,7 +36,7 @@ class ProfileJudge:
     def _build_prompt(self, profile: FinalProfile, raw: List[Dict[str, Any]]) -> str:
         import json as _json
         policy = {
-            "source_priority": ["LinkedIn-Verify", "ESPY", "GitHub", "Numverify", "OpenCage", "Holehe-Modules", "GHunt", "X-Verify", "LinkedIn-Finder", "X-Finder"],
+            "source_priority": SOURCE_PRIORITY,
             "rules": [
                 "Use only facts present in raw evidence; do not invent data.",
                 "If a field in the profile lacks any supporting evidence, drop it.",
@@ -48,9 +49,9 @@ class ProfileJudge:
         return (
             "You are a strict validator. Sanitize a person profile using raw evidence.\n"
             "Follow policy exactly. If unknown, omit. No speculation.\n\n"
-            f"Policy:\n{_json.dumps(policy, separators=(",", ":"))}\n\n"
+            f"Policy:\n{_json.dumps(policy, separators=(',', ':'))}\n\n"
             f"InputProfile:\n{profile.model_dump_json()}\n\n"
-            f"RawEvidence:\n{_json.dumps(raw, default=str) }\n\n"
+            f"RawEvidence:\n{_json.dumps(raw, separators=(',', ':'), default=str)}\n\n"
             "Output schema strictly:\n"
             "{\n  \"judged_profile\": {\"full_name\": str, \"summary\": str, \"locations\": [str], \"employment_history\": [object]},\n"
             "  \"field_confidence\": {str: float},\n  \"provenance\": {str: [str]},\n  \"warnings\": [str]\n}\n"
@@ -63,7 +64,8 @@ class ProfileJudge:
         except Exception:
             return {}
 
-    def _fallback(self, profile: FinalProfile, raw: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _fallback(self, profile: FinalProfile, raw: List[Dict[str, Any]], degraded: bool = True) -> Dict[str, Any]:
+        # `degraded` marks a model failure or timeout, as opposed to running without a model configured
         prov: Dict[str, List[str]] = {}
         conf: Dict[str, float] = {}
         sources = [item.get("source") or "" for item in raw]
@@ -78,6 +80,7 @@ class ProfileJudge:
             "field_confidence": conf,
             "provenance": prov,
             "warnings": [],
+            "degraded": degraded,
         }
 
 
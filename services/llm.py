@@ -1,5 +1,26 @@
+import hashlib
+import json
+import logging
 import os
-from typing import Optional
+import time
+from typing import Any, Dict, Optional
+from services.cache import build_cache
+from services.deadline import current_deadline, within_deadline
+from services.singleflight import SingleFlight
+
+# Identical prompts (same model, prompt and generation_config) are answered from here instead of Gemini.
+# Only the response text is kept, so calls that read function calls must pass cache=False.
+_responses = build_cache("llm_responses", "LLM_CACHE", default_max_entries=2048)
+_inflight = SingleFlight()
+_saved_s = 0.0
+_log = logging.getLogger(__name__)
+
+
+class CachedResponse:
+    # Stands in for a Gemini response on a cache hit; callers only read `.text`
+    def __init__(self, text: str):
+        self.text = text
+        self.cached = True
 
 
 def get_gemini_model(model_name: str = "gemini-2.5-flash", tools: Optional[dict] = None):
@@ -11,3 +32,46 @@ def get_gemini_model(model_name: str = "gemini-2.5-flash", tools: Optional[dict]
     return genai.GenerativeModel(model_name, tools=tools) if tools else genai.GenerativeModel(model_name)
 
 
+def _cache_key(model: Any, args: Any, kwargs: Dict[str, Any]) -> str:
+    payload = json.dumps(
+        {"model": getattr(model, "model_name", str(model)), "prompt": args, "config": kwargs.get("generation_config")},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+async def generate_content(model, *args: Any, cache: bool = True, **kwargs: Any) -> Any:
+    # All Gemini calls go through here so they are bounded by the request deadline and cached
+    ttl_s = float(os.getenv("LLM_CACHE_TTL_S", "86400"))
+    if not cache or ttl_s <= 0 or os.getenv("LLM_CACHE_ENABLE", "true").lower() != "true":
+        return await within_deadline(model.generate_content_async(*args, **kwargs))
+    key = _cache_key(model, args, kwargs)
+    hit = _responses.get(key)
+    if hit is not None:
+        global _saved_s
+        _saved_s += hit["latency_s"]
+        _log.info("LLM cache hit %s (saved %.2fs)", key[:12], hit["latency_s"])
+        return CachedResponse(hit["text"])
+    # The shared call runs under the first caller's deadline, so only callers whose deadlines expire
+    # in the same second share it (as with the response-level coalescing)
+    deadline = current_deadline()
+    flight_key = f"{key}:{int(deadline.expires_at) if deadline is not None else 'none'}"
+    return await _inflight.do(flight_key, lambda: _generate_and_store(model, key, ttl_s, args, kwargs))
+
+
+async def _generate_and_store(model: Any, key: str, ttl_s: float, args: Any, kwargs: Dict[str, Any]) -> Any:
+    t0 = time.monotonic()
+    response = await within_deadline(model.generate_content_async(*args, **kwargs))
+    try:
+        text = response.text
+    except Exception:
+        # Function-call or blocked responses have no text; nothing to cache
+        return response
+    if text:
+        _responses.set(key, {"text": text, "latency_s": round(time.monotonic() - t0, 3)}, ttl_s)
+    return response
+
+
+def llm_cache_stats() -> Dict[str, Any]:
+    return {**_responses.stats(), "coalesced": _inflight.coalesced, "saved_latency_s": round(_saved_s, 3)}
@@ -1,21 +1,28 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional, AsyncIterator, Awaitable, Callable, Tuple
 import asyncio
+import hashlib
+import json
 import logging
 import os
-from schemas import SearchQuery, FinalProfile, Candidate
-from .ai_agent import parse_user_request, synthesize_profile, generate_search_hint
+import uuid
+from schemas import SearchQuery, FinalProfile, Candidate, ShallowResponse, DeepResponse
+from .ai_agent import extract_query_and_hint, synthesize_profile
+from tools.base import BaseTool
 from tools.registry import ToolRegistry
-from tools.linkedin_finder import LinkedInFinderTool
-from tools.linkedin_verify import LinkedInVerifyTool
-from tools.ghunt import GHuntTool
 from .analysis import IdentityAnalysisService
 from .link_cache import LinkCache
 from .region import RegionResolver
 from .geocoding import geocode_location, country_to_mkt
+from .evidence import compact_evidence
 from .judge import ProfileJudge
+from .stage_graph import StageGraph
+from .singleflight import SingleFlight
+from .cache import build_cache
+from .llm import llm_cache_stats
+from .tool_chain import ToolChain
+from .deadline import Deadline, current_deadline, use_deadline, within_deadline
 import phonenumbers
 
-
 class SearchOrchestrator:
     def __init__(self):
         self.tool_registry = ToolRegistry()
@@ -24,139 +31,478 @@ class SearchOrchestrator:
         self._link_cache = LinkCache()
         self._region = RegionResolver()
         self._judge = ProfileJudge()
+        self._inflight = SingleFlight()
+        self._responses = build_cache("responses", "RESPONSE_CACHE", default_max_entries=512)
+        self._sessions = build_cache("sessions", "SEARCH_SESSION", default_max_entries=1024)
 
-    async def perform_shallow_search(self, query: SearchQuery) -> Dict[str, Any]:
-        params = query.model_dump(exclude_none=True)
-        self._log.info("Shallow input keys=%s", list(params.keys()))
-        if query.free_text_context:
-            extracted = await parse_user_request(query.free_text_context)
-            for k, v in extracted.model_dump(exclude_none=True).items():
-                params.setdefault(k, v)
-        self._log.info("Shallow merged keys=%s", list(params.keys()))
-        if params.get("location"):
-            try:
-                geo = await geocode_location(params["location"], language="en")
-                if not geo.get("error"):
-                    raw_geo = {"source": "OpenCage", "raw_data": geo}
-                    cc = (geo.get("components") or {}).get("country_code")
-                    if cc:
-                        params.setdefault("country", cc)
-                        params.setdefault("mkt", country_to_mkt(cc))
-                else:
-                    raw_geo = {"source": "OpenCage", "raw_data": geo}
-            except Exception as e:
-                raw_geo = {"source": "OpenCage", "raw_data": {"error": str(e)}}
-        else:
-            raw_geo = None
-
-        region = self._region.infer(params)
-        if region.get("mkt"):
-            params.setdefault("mkt", region["mkt"])
-        if region.get("country"):
-            params.setdefault("country", region["country"])
-        if params.get("free_text_context"):
-            hint = await generate_search_hint(params["free_text_context"])
-            if hint:
-                params.setdefault("search_hint", hint)
-        raw_results = await self.tool_registry.execute_tools(params, stage="shallow")
-        if raw_geo:
-            raw_results.insert(0, raw_geo)
-
-        best_linkedin = self._extract_best_url(raw_results, source="LinkedIn-Finder")
-        best_x = self._extract_best_url(raw_results, source="X-Finder")
-        verify_params = dict(params)
-        fp = LinkCache.fingerprint(verify_params)
-        if not best_linkedin:
-            cached_li = self._link_cache.get_best("linkedin", fp)
-            if cached_li:
-                best_linkedin = cached_li
-        else:
-            self._link_cache.set_best("linkedin", fp, best_linkedin)
-        if not best_x:
-            cached_x = self._link_cache.get_best("x", fp)
-            if cached_x:
-                best_x = cached_x
-        else:
-            self._link_cache.set_best("x", fp, best_x)
-        if best_linkedin:
-            verify_params["linkedin_finder_best_url"] = best_linkedin
-        if best_x:
-            verify_params["x_finder_best_url"] = best_x
-        if best_linkedin or best_x:
-            tools = self.tool_registry.get_applicable_tools(verify_params, stage="shallow")
-            verify_names = {"linkedin_verify", "x_verify"}
-            verify_tools = [t for t in tools if getattr(t, "name", "") in verify_names]
-            if verify_tools:
-                tasks = [t.execute(verify_params) for t in verify_tools]
-                verify_results = await asyncio.gather(*tasks, return_exceptions=True)
-                for r in verify_results:
-                    if isinstance(r, Exception):
-                        raw_results.append({"source": "error", "raw_data": {}, "error": str(r)})
-                    else:
-                        raw_results.append(r)
+    async def perform_shallow_search(self, query: SearchQuery, use_cache: bool = True) -> Dict[str, Any]:
+        key = self._request_key("shallow", query.model_dump(exclude_none=True))
+        if use_cache:
+            cached = self._responses.get(key)
+            if cached is not None:
+                self._log.info("Shallow response cache hit")
+                return cached
+        return await self._inflight.do(self._flight_key(key, use_cache), lambda: self._cache_response("shallow", key, self._run_shallow_search(query)))
+
+    async def stream_batch_search(self, queries: List[SearchQuery]) -> AsyncIterator[Dict[str, Any]]:
+        # Yields {"index", "result"|"error"} per query as each finishes. Queries share a concurrency
+        # budget and identical tool calls across them (same email/phone/username...) run once.
+        limit = asyncio.Semaphore(max(1, int(os.getenv("BATCH_SEARCH_CONCURRENCY", "4"))))
+
+        async def _one(index: int, query: SearchQuery) -> Dict[str, Any]:
+            async with limit:
+                try:
+                    return {"index": index, "result": await self.perform_shallow_search(query)}
+                except Exception as e:
+                    self._log.exception("Batch query %d failed", index)
+                    return {"index": index, "error": str(e)}
+
+        with self.tool_registry.shared_calls():
+            tasks = [asyncio.ensure_future(_one(i, q)) for i, q in enumerate(queries)]
+        try:
+            for fut in asyncio.as_completed(tasks):
+                yield await fut
+        finally:
+            for t in tasks:
+                t.cancel()
+
+    async def _run_shallow_search(self, query: SearchQuery) -> Dict[str, Any]:
+        result: Dict[str, Any] = {"candidates": [], "raw": []}
+        async for event in self.stream_shallow_search(query):
+            if event.get("event") == "result":
+                result = event["data"]
+        return result
+
+    async def stream_shallow_search(self, query: SearchQuery) -> AsyncIterator[Dict[str, Any]]:
+        # Events: "geocode", "tool_started", "tool_result", "verify_result", then a final "result" with candidates + raw + session_id
+        queue: asyncio.Queue = asyncio.Queue()
+        stages: Dict[str, Any] = {}
+        async for event in self._drain_graph(self._build_shallow_graph(query, queue.put_nowait), queue, stages, current_deadline()):
+            yield event
+
+        params = stages["context"]
+        raw_results: List[Dict[str, Any]] = []
+        if stages["geocode"]:
+            raw_results.append(stages["geocode"])
+        # Streamed in completion order above; the aggregated result is in registry order so it is deterministic
+        raw_results.extend(self.tool_registry.in_registry_order(stages["tools"] + stages["producers"] + stages["discover"]["finders"]))
+        raw_results.extend(self.tool_registry.user_input_results(params))
+        raw_results.extend(self.tool_registry.in_registry_order(stages["discover"]["verify"]))
 
         candidates = self._build_candidates_from_shallow(raw_results, params)
         self._log.info("Shallow candidates=%d", len(candidates))
+        self.tool_registry.stats.record_contributions(raw_results, params, candidates)
         try:
             analysis = self._analysis.analyze(raw_results)
             raw_results.append({"source": "Analysis", "raw_data": analysis})
         except Exception:
             pass
-        return {"candidates": candidates, "raw": raw_results}
+        session_id = self._save_session({**params, **stages["discover"]["urls"]}, raw_results)
+        yield {"event": "result", "data": {"candidates": candidates, "raw": raw_results, "session_id": session_id}}
+
+    def _build_shallow_graph(self, query: SearchQuery, emit: Callable[[Dict[str, Any]], None]) -> StageGraph:
+        # understand ─> extract ─┬─> tools (everything not waiting on mkt/search_hint and producing nothing)
+        #                        ├─> producers (tools whose outputs feed the chain, e.g. GitHub-Extras) ┄┐
+        #                        └─> geocode ─> context ─────────────────────────────────────────────> discover (finders)
+        # understand is a single LLM call yielding both the extracted fields and the finders' search hint.
+        # discover follows the producers' results and its own finders through one chain: a URL produced by
+        # any tool (GitHub-Extras links, finder results) starts its verify tool with the context params
+        # (geocoded country included). Only context gates the finders; discover waits for the producers
+        # for at most TOOL_CHAIN_PRODUCERS_WAIT_MS so finders whose outputs are already known can be skipped,
+        # and verifies the producers' outputs whenever they arrive (the chain runs each URL once).
+        text = query.free_text_context
+        graph = StageGraph()
+        chain = ToolChain(self.tool_registry, stage="shallow")
+        produced: List[Dict[str, Any]] = []
+        producers_done = asyncio.Event()
+
+        async def understand(_: Dict[str, Any]) -> Tuple[SearchQuery, str]:
+            # One LLM call for both the extracted fields and the finders' search hint
+            return await extract_query_and_hint(text) if text else (SearchQuery(), "")
+
+        async def extract(deps: Dict[str, Any]) -> Dict[str, Any]:
+            params = query.model_dump(exclude_none=True)
+            self._log.info("Shallow input keys=%s", list(params.keys()))
+            extracted, _ = deps["understand"]
+            for k, v in extracted.model_dump(exclude_none=True).items():
+                params.setdefault(k, v)
+            self._log.info("Shallow merged keys=%s", list(params.keys()))
+            return params
+
+        async def geocode(deps: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            location = deps["extract"].get("location")
+            if not location:
+                return None
+            try:
+                geo = await within_deadline(geocode_location(location, language="en"))
+            except asyncio.TimeoutError:
+                geo = {"error": "deadline_exceeded"}
+            except Exception as e:
+                geo = {"error": str(e)}
+            raw_geo = {"source": "OpenCage", "raw_data": geo}
+            emit({"event": "geocode", "data": raw_geo})
+            return raw_geo
+
+        async def context(deps: Dict[str, Any]) -> Dict[str, Any]:
+            params = dict(deps["extract"])
+            geo = (deps["geocode"] or {}).get("raw_data") or {}
+            if not geo.get("error"):
+                cc = (geo.get("components") or {}).get("country_code")
+                if cc:
+                    params.setdefault("country", cc)
+                    params.setdefault("mkt", country_to_mkt(cc))
+            region = self._region.infer(params)
+            if region.get("mkt"):
+                params.setdefault("mkt", region["mkt"])
+            if region.get("country"):
+                params.setdefault("country", region["country"])
+            _, hint = deps["understand"]
+            if hint:
+                params.setdefault("search_hint", hint)
+            return params
+
+        async def tools(deps: Dict[str, Any]) -> List[Dict[str, Any]]:
+            params = deps["extract"]
+            selected = [t for t in self.tool_registry.get_applicable_tools(params, stage="shallow") if not t.waits_for and not t.produces]
+            return await self._collect(selected, params, "tool_result", emit)
+
+        async def producers(deps: Dict[str, Any]) -> List[Dict[str, Any]]:
+            params = deps["extract"]
+            selected = [t for t in self.tool_registry.get_applicable_tools(params, stage="shallow") if not t.waits_for and t.produces]
+            try:
+                results = await self._collect(selected, params, "tool_result", emit)
+                produced.extend(results)
+                return results
+            finally:
+                producers_done.set()
+
+        async def discover(deps: Dict[str, Any]) -> Dict[str, Any]:
+            params = deps["context"]
+            fp = LinkCache.fingerprint(params)
+            finder_results: List[Dict[str, Any]] = []
+            verify_results: List[Dict[str, Any]] = []
+
+            def _add(r: Dict[str, Any]) -> None:
+                if (r.get("meta") or {}).get("chained_from"):
+                    verify_results.append(r)
+                    emit({"event": "verify_result", "data": r})
+                else:
+                    finder_results.append(r)
+                    emit({"event": "tool_result", "data": r})
+
+            # Verifies for the producers' outputs start here rather than in producers, so they get the country
+            wait_s = int(os.getenv("TOOL_CHAIN_PRODUCERS_WAIT_MS", "1500")) / 1000.0
+            deadline = current_deadline()
+            if deadline is not None:
+                wait_s = min(wait_s, deadline.remaining() / 2)
+            try:
+                await asyncio.wait_for(producers_done.wait(), timeout=wait_s)
+            except asyncio.TimeoutError:
+                self._log.info("Starting finders without waiting further for producers (%dms)", int(wait_s * 1000))
+            followed = len(produced)
+            calls = [c for r in produced[:followed] for c in chain.follow(r, params)]
+            selected = [t for t in self.tool_registry.get_applicable_tools(params, stage="shallow") if t.waits_for]
+            known = [t for t in selected if t.produces and all(p in chain.produced for p in t.produces)]
+            if known:
+                self._log.info("Skipping finders with outputs already produced: %s", [t.name for t in known])
+            calls.extend((t, params, 0, None) for t in selected if t not in known)
+            for t, _, _, _ in calls:
+                emit({"event": "tool_started", "data": {"tool": t.name}})
+            async for r in self.tool_registry.iter_calls(calls, chain):
+                _add(r)
+            # Producers that outlasted the wait: verify the outputs the finders did not already produce
+            await producers_done.wait()
+            late = [c for r in produced[followed:] for c in chain.follow(r, params)]
+            async for r in self.tool_registry.iter_calls(late, chain):
+                _add(r)
+            # Finders that did not run (or failed) can still verify a recently cached URL
+            fallback = []
+            for tool in self.tool_registry.get_tools_by_stage("shallow"):
+                for param_key in tool.produces:
+                    if param_key not in chain.produced:
+                        fallback.extend(chain.offer(param_key, self._link_cache.get_best(param_key, fp), params, source="link_cache"))
+            async for r in self.tool_registry.iter_calls(fallback, chain):
+                _add(r)
+            for param_key, url in chain.produced.items():
+                self._link_cache.set_best(param_key, fp, url)
+            return {"finders": finder_results, "verify": verify_results, "urls": dict(chain.produced)}
+
+        graph.add("understand", understand)
+        graph.add("extract", extract, deps=["understand"])
+        graph.add("geocode", geocode, deps=["extract"])
+        graph.add("context", context, deps=["understand", "extract", "geocode"])
+        graph.add("tools", tools, deps=["extract"])
+        graph.add("producers", producers, deps=["extract"])
+        graph.add("discover", discover, deps=["context"])
+        return graph
 
-    async def perform_deep_search(self, candidate: Candidate) -> Dict[str, Any]:
+    async def _collect(
+        self,
+        tools: List[BaseTool],
+        params: Dict[str, Any],
+        event: str,
+        emit: Callable[[Dict[str, Any]], None],
+        chain: Optional[ToolChain] = None,
+        chained_event: Optional[str] = None,
+        seeds: Iterable[Dict[str, Any]] = (),
+    ) -> List[Dict[str, Any]]:
+        # With a chain, tools triggered by these results (or by earlier `seeds`) run and are collected too
+        calls = [(t, params, 0, None) for t in tools]
+        if chain is not None:
+            for r in seeds:
+                calls.extend(chain.follow(r, params))
+        for t, _, _, _ in calls:
+            emit({"event": "tool_started", "data": {"tool": t.name}})
+        out: List[Dict[str, Any]] = []
+        async for r in self.tool_registry.iter_calls(calls, chain):
+            out.append(r)
+            chained = (r.get("meta") or {}).get("chained_from")
+            emit({"event": (chained_event or event) if chained else event, "data": r})
+        return self.tool_registry.in_registry_order(out)
+
+    async def _drain_graph(self, graph: StageGraph, queue: asyncio.Queue, stages: Dict[str, Any], deadline: Optional[Deadline]) -> AsyncIterator[Dict[str, Any]]:
+        # Runs the graph under `deadline`, yielding whatever its stages emit; stage results land in `stages` at the end
+        async def _run() -> Dict[str, Any]:
+            try:
+                with use_deadline(deadline):
+                    return await graph.run()
+            finally:
+                queue.put_nowait(None)
+
+        runner = asyncio.ensure_future(_run())
+        try:
+            while True:
+                event = await queue.get()
+                if event is None:
+                    break
+                yield event
+            stages.update(await runner)
+        finally:
+            runner.cancel()
+
+    async def perform_deep_search(self, candidate: Candidate, use_cache: bool = True, session_id: Optional[str] = None) -> Dict[str, Any]:
+        session = self._load_session(session_id)
+        key = self._deep_key(candidate, session_id if session else None)
+        if use_cache:
+            cached = self._responses.get(key)
+            if cached is not None:
+                self._log.info("Deep response cache hit")
+                return cached
+        return await self._inflight.do(self._flight_key(key, use_cache), lambda: self._cache_response("deep", key, self._run_deep_search(candidate, session)))
+
+    async def stream_deep_search(self, candidate: Candidate, use_cache: bool = True, session_id: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        # Events: "tool_started", "tool_result", "synthesis", "judge", then a final "result" with profile + raw
+        session = self._load_session(session_id)
+        key = self._deep_key(candidate, session_id if session else None)
+        if use_cache:
+            cached = self._responses.get(key)
+            if cached is not None:
+                yield {"event": "result", "data": cached}
+                return
+        async for event in self._stream_deep(candidate, session):
+            if event.get("event") == "result":
+                self._store_response("deep", key, event["data"])
+            yield event
+
+    async def _cache_response(self, stage: str, key: str, run: Awaitable[Dict[str, Any]]) -> Dict[str, Any]:
+        result = await run
+        self._store_response(stage, key, result)
+        return result
+
+    def _store_response(self, stage: str, key: str, result: Dict[str, Any]) -> None:
+        ttl_s = float(os.getenv(f"RESPONSE_CACHE_{stage.upper()}_TTL_S", "900" if stage == "shallow" else "3600"))
+        # Partial results cut short by a request deadline, or profiles from the synthesis/judge fallback, are never cached
+        partial = result.get("degraded") or any((r.get("raw_data") or {}).get("status") == "deadline_exceeded" for r in result.get("raw") or [])
+        if ttl_s > 0 and not partial:
+            model = ShallowResponse if stage == "shallow" else DeepResponse
+            try:
+                self._responses.set(key, model.model_validate(result).model_dump(mode="json"), ttl_s)
+            except Exception:
+                self._log.exception("Could not cache %s response", stage)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        return {
+            "responses": self._responses.stats(),
+            "tool_results": self.tool_registry.cache_stats(),
+            "sessions": self._sessions.stats(),
+            "in_flight": self._inflight.stats(),
+            "llm": llm_cache_stats(),
+        }
+
+    def _save_session(self, params: Dict[str, Any], raw_results: List[Dict[str, Any]]) -> Optional[str]:
+        # Keeps a search's inputs and raw evidence so /profile/enrich can reuse them instead of refetching
+        ttl_s = float(os.getenv("SEARCH_SESSION_TTL_S", "1800"))
+        if ttl_s <= 0:
+            return None
+        session_id = uuid.uuid4().hex
+        self._sessions.set(session_id, {"params": params, "raw": raw_results}, ttl_s)
+        return session_id
+
+    def _load_session(self, session_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        if not session_id:
+            return None
+        session = self._sessions.get(session_id)
+        if session is None:
+            self._log.info("Search session %s expired or unknown; enriching from scratch", session_id[:12])
+        return session
+
+    def _deep_key(self, candidate: Candidate, session_id: Optional[str]) -> str:
+        params = candidate.model_dump(exclude_none=True)
+        if session_id:
+            params["session_id"] = session_id
+        return self._request_key("deep", params)
+
+    def _session_evidence(self, session: Optional[Dict[str, Any]], params: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        # Successful shallow results by tool, kept only when the candidate agrees with the inputs
+        # that produced them (same call key), so evidence about other candidates is left out
+        if not session:
+            return {}
+        seen = session.get("params") or {}
+        merged = {**seen, **params}
+        evidence: Dict[str, Dict[str, Any]] = {}
+        for r in session.get("raw") or []:
+            if r.get("error") or (r.get("raw_data") or {}).get("error"):
+                continue
+            meta = r.get("meta") or {}
+            tool = self.tool_registry.get_tool(meta.get("tool") or "")
+            if tool is None or tool.call_key(seen) != tool.call_key(merged):
+                continue
+            evidence[tool.name] = {**r, "meta": {**meta, "reused": True}}
+        return evidence
+
+    async def _run_deep_search(self, candidate: Candidate, session: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        result: Dict[str, Any] = {}
+        async for event in self._stream_deep(candidate, session):
+            if event.get("event") == "result":
+                result = event["data"]
+        return result
+
+    async def _stream_deep(self, candidate: Candidate, session: Optional[Dict[str, Any]] = None) -> AsyncIterator[Dict[str, Any]]:
         params = candidate.model_dump(exclude_none=True)
         self._log.info("Deep input candidate keys=%s", list(params.keys()))
+        evidence = self._session_evidence(session, params)
+        if evidence:
+            self._log.info("Deep reusing session evidence from %s", sorted(evidence))
 
-        # Optionally discover Google Reviews URL (GHunt) and queue a scrape
-        additional_results: List[Dict[str, Any]] = []
-        try:
-            ghunt = GHuntTool()
-            if ghunt.can_handle(params):
-                gh_res = await ghunt.execute(params)
-                additional_results.append(gh_res)
-                reviews_url = (((gh_res or {}).get("raw_data") or {}).get("google_osint") or {}).get("reviews_url") or ""
-                if isinstance(reviews_url, str) and reviews_url:
-                    # Inject Hyperbrowser scrape request so it participates in deep tool execution
-                    scrape_timeout = int(os.getenv("HYPERBROWSER_SCRAPE_PER_REQUEST_TIMEOUT_MS", os.getenv("HYPERBROWSER_SCRAPE_TIMEOUT_MS", os.getenv("HYPERBROWSER_TIMEOUT_MS", "30000"))))
-                    params.setdefault("hyperbrowser", {})
-                    hb = params["hyperbrowser"]
-                    hb.setdefault("scrape", {})
-                    hb_scrape = hb["scrape"]
-                    hb_scrape.setdefault("urls", [])
-                    if reviews_url not in hb_scrape["urls"]:
-                        hb_scrape["urls"].append(reviews_url)
-                    hb_scrape.setdefault("formats", ["markdown"])  # compact, easy to LLM
-                    hb_scrape.setdefault("only_main_content", True)
-                    hb_scrape.setdefault("timeout_ms", scrape_timeout)
-        except Exception as e:
-            additional_results.append({"source": "GHunt", "raw_data": {"error": str(e)}})
-
-        deep_results = await self.tool_registry.execute_tools(params, stage="deep")
-        if additional_results:
-            deep_results = additional_results + deep_results
+        # Tools stop early enough to leave the synthesis + judge calls part of the request budget
+        deadline = current_deadline()
+        reserve_s = int(os.getenv("REQUEST_DEADLINE_SYNTHESIS_RESERVE_MS", "15000")) / 1000.0
+        queue: asyncio.Queue = asyncio.Queue()
+        stages: Dict[str, Any] = {}
+        seen = (session or {}).get("params") or {}
+        graph = self._build_deep_graph(params, queue.put_nowait, evidence, seen)
+        async for event in self._drain_graph(graph, queue, stages, deadline.reserve(reserve_s) if deadline else None):
+            yield event
+        deep_results: List[Dict[str, Any]] = []
+        if stages["ghunt"]:
+            deep_results.append(stages["ghunt"])
+        deep_results.extend(stages["tools"])
+        if stages["reviews_scrape"]:
+            deep_results.append(stages["reviews_scrape"])
+        if stages["linkedin_verify"]:
+            deep_results.append(stages["linkedin_verify"])
+        # Remaining shallow evidence (finders, GitHub, Holehe...) goes straight into synthesis, unless the
+        # deep graph already has that tool's result (reused or run again)
+        ran = {(d.get("meta") or {}).get("tool") for d in deep_results}
+        deep_results.extend(r for name, r in evidence.items() if name not in ran)
 
-        try:
-            fp = LinkCache.fingerprint(params)
-            best_li = self._link_cache.get_best("linkedin", fp)
-            if not best_li and params.get("email"):
-                best_li = None
-            if best_li:
-                li_verify = LinkedInVerifyTool()
-                ver_params = dict(params)
-                ver_params["linkedin_finder_best_url"] = best_li
-                if li_verify.can_handle(ver_params):
-                    vres = await li_verify.execute(ver_params)
-                    deep_results.append(vres)
-        except Exception as e:
-            deep_results.append({"source": "error", "raw_data": {}, "error": str(e)})
-        agg = [{"source": "candidate", "raw_data": params}] + deep_results
-        profile = await synthesize_profile(agg)
-        judge_res = await self._judge.judge(profile, deep_results)
+        # Synthesis and the judge read one compacted, token-budgeted copy; the full results stay in "raw"
+        compacted, evidence_stats = compact_evidence(deep_results)
+        yield {"event": "synthesis", "data": {"status": "started", "evidence": evidence_stats}}
+        profile, degraded = await synthesize_profile([{"source": "candidate", "raw_data": params}] + compacted)
+        yield {"event": "judge", "data": {"status": "started"}}
+        judge_res = await self._judge.judge(profile, compacted)
         if isinstance(judge_res, dict) and judge_res.get("judged_profile"):
             deep_results.append({"source": "Judge", "raw_data": {k: (v.model_dump() if hasattr(v, 'model_dump') else v) for k, v in judge_res.items()}})
             profile = judge_res["judged_profile"]
-        return {"profile": profile, "raw": deep_results}
+        degraded = degraded or bool(isinstance(judge_res, dict) and judge_res.get("degraded"))
+        # Reused session evidence was already credited by the shallow search
+        fresh = [r for r in deep_results if not (r.get("meta") or {}).get("reused")]
+        self.tool_registry.stats.record_contributions(fresh, params, profile)
+        yield {"event": "result", "data": {"profile": profile, "raw": deep_results, "degraded": degraded}}
+
+    def _build_deep_graph(
+        self,
+        params: Dict[str, Any],
+        emit: Callable[[Dict[str, Any]], None],
+        evidence: Optional[Dict[str, Dict[str, Any]]] = None,
+        seen: Optional[Dict[str, Any]] = None,
+    ) -> StageGraph:
+        # tools (ESPY, Holehe-resolver, Hyperbrowser) ─┐
+        # ghunt ─> reviews_scrape (Google reviews URL)  ├─> synthesis
+        # linkedin_verify (cached best URL) ───────────┘
+        # Tools with a fresh session result for the same inputs are not called again.
+        evidence = evidence or {}
+        seen = seen or {}
+        graph = StageGraph()
+
+        def reused(tool: BaseTool, tool_params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            prior = evidence.get(tool.name)
+            if prior is None or tool.call_key(tool_params) != tool.call_key(seen):
+                return None
+            emit({"event": "tool_result", "data": prior})
+            return prior
+
+        async def run_one(tool: BaseTool, tool_params: Dict[str, Any]) -> Dict[str, Any]:
+            prior = reused(tool, tool_params)
+            if prior is not None:
+                return prior
+            return (await self._collect([tool], tool_params, "tool_result", emit))[0]
+
+        async def tools(_: Dict[str, Any]) -> List[Dict[str, Any]]:
+            selected = self.tool_registry.get_applicable_tools(params, stage="deep")
+            prior = [r for r in (reused(t, params) for t in selected) if r is not None]
+            fresh = [t for t in selected if t.name not in {(r.get("meta") or {}).get("tool") for r in prior}]
+            # Session evidence can feed deep tools too, e.g. a GitHub-Extras website into a (paid) Hyperbrowser
+            # scrape; off unless TOOL_CHAIN_DEEP_FROM_SESSION=true
+            chain = ToolChain(self.tool_registry, stage="deep")
+            seeds = evidence.values() if os.getenv("TOOL_CHAIN_DEEP_FROM_SESSION", "false").lower() == "true" else ()
+            results = await self._collect(fresh, params, "tool_result", emit, chain=chain, seeds=seeds)
+            return prior + results + self.tool_registry.user_input_results(params)
+
+        async def ghunt(_: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            tool = self.tool_registry.get_tool("GHunt")
+            if not tool or not tool.can_handle(params):
+                return None
+            return await run_one(tool, params)
+
+        async def reviews_scrape(deps: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            gh_res = deps["ghunt"] or {}
+            reviews_url = ((gh_res.get("raw_data") or {}).get("google_osint") or {}).get("reviews_url") or ""
+            if not isinstance(reviews_url, str) or not reviews_url:
+                return None
+            scrape_timeout = int(os.getenv("HYPERBROWSER_SCRAPE_PER_REQUEST_TIMEOUT_MS", os.getenv("HYPERBROWSER_SCRAPE_TIMEOUT_MS", os.getenv("HYPERBROWSER_TIMEOUT_MS", "30000"))))
+            scrape_params = dict(params)
+            scrape_params["hyperbrowser"] = {
+                "scrape": {
+                    "urls": [reviews_url],
+                    "formats": ["markdown"],  # compact, easy to LLM
+                    "only_main_content": True,
+                    "timeout_ms": scrape_timeout,
+                }
+            }
+            tool = self.tool_registry.get_tool("hyperbrowser_scrape")
+            if not tool or not tool.can_handle(scrape_params):
+                return None
+            return await run_one(tool, scrape_params)
+
+        async def linkedin_verify(_: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            best_li = self._link_cache.get_best("linkedin_finder_best_url", LinkCache.fingerprint(params)) or seen.get("linkedin_finder_best_url")
+            if not best_li:
+                return None
+            # The session's context (geocoded country, mkt) picks the same proxy region and call key as the shallow verify
+            ver_params = {**seen, **params}
+            ver_params["linkedin_finder_best_url"] = best_li
+            tool = self.tool_registry.get_tool("linkedin_verify")
+            if not tool or not tool.can_handle(ver_params):
+                return None
+            return await run_one(tool, ver_params)
+
+        graph.add("tools", tools)
+        graph.add("ghunt", ghunt)
+        graph.add("reviews_scrape", reviews_scrape, deps=["ghunt"])
+        graph.add("linkedin_verify", linkedin_verify)
+        return graph
 
     def _build_candidates_from_shallow(self, raw_results: List[Dict[str, Any]], seed_params: Dict[str, Any]) -> List[Candidate]:
         merged: Dict[str, Dict[str, Any]] = {}
@@ -247,6 +593,28 @@ class SearchOrchestrator:
             distinct.append(c)
         return [Candidate(**c) for c in distinct]
 
+    def _flight_key(self, key: str, use_cache: bool) -> str:
+        # Only requests that would run the same way share one execution: the same cache bypass and
+        # deadlines expiring in the same second (so no waiter gets a result cut much shorter than its own)
+        deadline = current_deadline()
+        bucket = int(deadline.expires_at) if deadline is not None else "none"
+        return f"{key}:{'cached' if use_cache else 'fresh'}:{bucket}"
+
+    def _request_key(self, stage: str, params: Dict[str, Any]) -> str:
+        # Identity of a request after normalization, so trivially different spellings coalesce/cache together
+        norm: Dict[str, Any] = {"stage": stage, "fingerprint": LinkCache.fingerprint(params)}
+        for k, v in params.items():
+            if isinstance(v, str):
+                norm[k] = v.strip().lower()
+            elif isinstance(v, list):
+                norm[k] = sorted(str(x).strip().lower() for x in v)
+            else:
+                norm[k] = v
+        if isinstance(params.get("phone"), str):
+            norm["phone"] = self._normalize_phone(params["phone"])
+        blob = json.dumps(norm, sort_keys=True, default=str)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
     def _normalize_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         out: Dict[str, Optional[str]] = {}
         email = data.get("email")
@@ -295,12 +663,3 @@ class SearchOrchestrator:
         if data.get("name"):
             score += 1
         return score
-
-    def _extract_best_url(self, raw_results: List[Dict[str, Any]], source: str) -> Optional[str]:
-        for item in raw_results:
-            if item.get("source") == source:
-                raw = item.get("raw_data") or {}
-                url = raw.get("best_url") or ""
-                if isinstance(url, str) and url:
-                    return url
-        return None
@@ -0,0 +1,52 @@
+import asyncio
+import importlib.util
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Optional, TypeVar
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def parser_backend() -> str:
+    # HTML_PARSER=auto picks lxml when installed (several times faster), else the stdlib parser
+    choice = os.getenv("HTML_PARSER", "auto").lower()
+    if choice == "auto":
+        return "lxml" if importlib.util.find_spec("lxml") is not None else "html.parser"
+    return choice
+
+
+def strainer(tags: Iterable[str] = (), attrs: Iterable[str] = (), classes: Iterable[str] = ()) -> SoupStrainer:
+    # Only build tree nodes for these tag names, tags carrying any of these attributes or any of these
+    # CSS classes (matched tags keep their whole subtree, so descendant selectors still work)
+    names, keys, wanted_classes = frozenset(tags), tuple(attrs), frozenset(classes)
+
+    def _wanted(name: str, tag_attrs: Any) -> bool:
+        if name in names:
+            return True
+        tag_attrs = tag_attrs or {}
+        if any(k in tag_attrs for k in keys):
+            return True
+        css = tag_attrs.get("class") or ""
+        return bool(wanted_classes) and not wanted_classes.isdisjoint(css.split() if isinstance(css, str) else css)
+
+    return SoupStrainer(_wanted)
+
+
+def make_soup(markup: Any, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    return BeautifulSoup(markup, parser_backend(), parse_only=parse_only)
+
+
+def _pool() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=int(os.getenv("HTML_PARSE_WORKERS", "4")), thread_name_prefix="html-parse")
+    return _executor
+
+
+async def parse_off_loop(fn: Callable[..., T], *args: Any) -> T:
+    # Parsing is CPU-bound: run it on a small bounded pool so a large page never stalls the event loop
+    return await asyncio.get_running_loop().run_in_executor(_pool(), fn, *args)
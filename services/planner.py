@@ -1,94 +1,8 @@
 import json
 from typing import Dict, Any
 from schemas import PlanResponse
-from services.llm import get_gemini_model
-
-_TOOL_MANIFEST = {
-    "function_declarations": [
-        {
-            "name": "hyperbrowser_scrape",
-            "description": "Fetch content for one or many URLs; prefer formats ['markdown','links'] and only_main_content=true.",
-            "parameters": {
-                "type": "OBJECT",
-                "properties": {
-                    "urls": {"type": "ARRAY", "items": {"type": "STRING"}},
-                    "formats": {"type": "ARRAY", "items": {"type": "STRING"}},
-                    "only_main_content": {"type": "BOOLEAN"},
-                    "timeout_ms": {"type": "NUMBER"}
-                },
-                "required": ["urls"]
-            }
-        },
-        {
-            "name": "hyperbrowser_extract",
-            "description": "Extract structured data from URLs via schema or prompt.",
-            "parameters": {
-                "type": "OBJECT",
-                "properties": {
-                    "urls": {"type": "ARRAY", "items": {"type": "STRING"}},
-                    "schema": {"type": "OBJECT"},
-                    "prompt": {"type": "STRING"},
-                    "max_links": {"type": "NUMBER"}
-                },
-                "required": ["urls"]
-            }
-        },
-        {
-            "name": "hyperbrowser_crawl",
-            "description": "Constrained crawl of a site to a small number of pages.",
-            "parameters": {
-                "type": "OBJECT",
-                "properties": {
-                    "url": {"type": "STRING"},
-                    "max_pages": {"type": "NUMBER"},
-                    "include_patterns": {"type": "ARRAY", "items": {"type": "STRING"}},
-                    "exclude_patterns": {"type": "ARRAY", "items": {"type": "STRING"}},
-                    "formats": {"type": "ARRAY", "items": {"type": "STRING"}},
-                    "only_main_content": {"type": "BOOLEAN"},
-                    "timeout_ms": {"type": "NUMBER"}
-                },
-                "required": ["url"]
-            }
-        },
-        # ESPY disabled by default for cost; can re-enable via env and manifest later
-        {
-            "name": "espy_phone",
-            "description": "High-cost phone enrichment; use only after strong identity match.",
-            "parameters": {
-                "type": "OBJECT",
-                "properties": {"phone": {"type": "STRING"}},
-                "required": ["phone"]
-            }
-        },
-        {
-            "name": "holehe_cli",
-            "description": "Discover services linked to an email.",
-            "parameters": {
-                "type": "OBJECT",
-                "properties": {"email": {"type": "STRING"}},
-                "required": ["email"]
-            }
-        },
-        {
-            "name": "numverify",
-            "description": "Validate phone format and metadata.",
-            "parameters": {
-                "type": "OBJECT",
-                "properties": {"phone": {"type": "STRING"}},
-                "required": ["phone"]
-            }
-        },
-        {
-            "name": "github",
-            "description": "Scrape GitHub by username.",
-            "parameters": {
-                "type": "OBJECT",
-                "properties": {"username": {"type": "STRING"}},
-                "required": ["username"]
-            }
-        }
-    ]
-}
+from services.llm import get_gemini_model, generate_content
+from tools.registry import planner_manifest_json
 
 _DEFAULT_BUDGET = {"max_steps": 5, "max_runtime_s": 60}
 
@@ -147,7 +61,7 @@ Context:
 {json.dumps({"stage": stage, "inputs": params}, separators=(",", ":"))}
 
 Tool manifest:
-{json.dumps(_TOOL_MANIFEST, separators=(",", ":"))}
+{planner_manifest_json()}
 
 Guidance:
 {json.dumps(guidance, separators=(",", ":"))}
@@ -166,7 +80,7 @@ Rules:
 - If inputs are insufficient for a tool, omit that step.
 Return only JSON.
 """
-    resp = await model.generate_content_async(prompt, generation_config={"response_mime_type": "application/json"})
+    resp = await generate_content(model, prompt, generation_config={"response_mime_type": "application/json"})
     try:
         return PlanResponse.model_validate_json(resp.text)
     except Exception:
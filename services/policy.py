@@ -0,0 +1,56 @@
+import asyncio
+import random
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+import httpx
+
+
+def is_transient_error(error: Any) -> bool:
+    # Worth retrying: timeouts, connection failures, throttling (429) and 5xx responses. Classified by
+    # exception type and status code only; messages carry request URLs and user input
+    if isinstance(error, httpx.HTTPStatusError):
+        code = error.response.status_code
+        return code == 429 or code >= 500
+    return isinstance(error, (asyncio.TimeoutError, TimeoutError, ConnectionError, httpx.TransportError))
+
+
+def is_transient_result(result: Dict[str, Any]) -> bool:
+    # Tools mark error results caused by a transient failure with "transient": true next to "error"
+    raw = result.get("raw_data") or {}
+    return bool(result_error(result)) and bool(result.get("transient") or raw.get("transient"))
+
+
+def result_error(result: Dict[str, Any]) -> Optional[str]:
+    # Tools report failures either top-level ("error") or inside raw_data
+    err = result.get("error") or (result.get("raw_data") or {}).get("error")
+    return str(err) if err else None
+
+
+class ExecutionPolicy:
+    def __init__(self, timeout_s: float = 0.0, retries: int = 0, retry_on_error: bool = False, hedge: bool = False, backoff_s: float = 0.2):
+        self.timeout_s = max(0.0, timeout_s)
+        self.retries = max(0, retries)
+        self.retry_on_error = retry_on_error
+        self.hedge = hedge
+        self.backoff_s = max(0.0, backoff_s)
+
+    def backoff(self, attempt: int) -> float:
+        # Full jitter: uniform over [0, backoff * 2^(attempt-1)], capped at 5s
+        return random.uniform(0, min(5.0, self.backoff_s * (2 ** (attempt - 1))))
+
+
+class LatencyWindow:
+    # Recent successful latencies of one tool; percentiles need `min_samples` observations
+    def __init__(self, size: int = 200, min_samples: int = 20):
+        self._samples: Deque[float] = deque(maxlen=max(1, size))
+        self._min_samples = max(1, min_samples)
+
+    def add(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if len(self._samples) < self._min_samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
@@ -1,14 +1,20 @@
+from functools import lru_cache
 from typing import Tuple, Optional, Dict
 from .config import load_resolver_config
 
-_alias_to_service: Dict[str, str] = {}
-for item in load_resolver_config():
-    svc = (item.get("service") or "").lower()
-    if not svc:
-        continue
-    _alias_to_service[svc] = svc
-    for alias in item.get("aliases", []) or []:
-        _alias_to_service[alias.lower()] = svc
+
+@lru_cache(maxsize=1)
+def _alias_to_service() -> Dict[str, str]:
+    # Built on first use rather than at import, so importing this module doesn't read config/resolvers.json
+    aliases: Dict[str, str] = {}
+    for item in load_resolver_config():
+        svc = (item.get("service") or "").lower()
+        if not svc:
+            continue
+        aliases[svc] = svc
+        for alias in item.get("aliases", []) or []:
+            aliases[alias.lower()] = svc
+    return aliases
 
 def canonicalize_service(label: str) -> Optional[Tuple[str, str]]:
     if not isinstance(label, str):
@@ -22,7 +28,7 @@ def canonicalize_service(label: str) -> Optional[Tuple[str, str]]:
     host = raw
     if "/" in host:
         host = host.split("/", 1)[0]
-    service = _alias_to_service.get(host, host)
+    service = _alias_to_service().get(host, host)
     return service, host
 
 
@@ -0,0 +1,35 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._log = logging.getLogger(__name__)
+        self.executed = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        # Concurrent callers with the same key await one execution and share its result.
+        # The execution is shielded so one caller disconnecting doesn't cancel it for the others.
+        fut = self._inflight.get(key)
+        if fut is None:
+            self.executed += 1
+            fut = asyncio.ensure_future(fn())
+            self._inflight[key] = fut
+            fut.add_done_callback(lambda f: self._done(key, f))
+        else:
+            self.coalesced += 1
+            self._log.info("Coalesced duplicate in-flight request key=%s", key[:12])
+        return await asyncio.shield(fut)
+
+    def _done(self, key: str, fut: asyncio.Future) -> None:
+        if self._inflight.get(key) is fut:
+            self._inflight.pop(key, None)
+        if not fut.cancelled():
+            # Mark the exception retrieved even if every waiter has gone away
+            fut.exception()
+
+    def stats(self) -> Dict[str, int]:
+        return {"in_flight": len(self._inflight), "executed": self.executed, "coalesced": self.coalesced}
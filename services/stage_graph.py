@@ -0,0 +1,51 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Tuple
+
+StageFn = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+# Runs each async stage as soon as its dependencies have finished. A stage receives its
+# dependencies' results keyed by stage name; deps must be added first, so the graph stays acyclic.
+class StageGraph:
+    def __init__(self) -> None:
+        self._stages: Dict[str, Tuple[StageFn, Tuple[str, ...]]] = {}
+        self._log = logging.getLogger(__name__)
+
+    def add(self, name: str, fn: StageFn, deps: Iterable[str] = ()) -> None:
+        deps = tuple(deps)
+        if name in self._stages:
+            raise ValueError(f"Duplicate stage: {name}")
+        for d in deps:
+            if d not in self._stages:
+                raise ValueError(f"Stage {name} depends on unknown stage {d}")
+        self._stages[name] = (fn, deps)
+
+    async def run(self) -> Dict[str, Any]:
+        results: Dict[str, Any] = {}
+        tasks: Dict[str, asyncio.Task] = {}
+        started_at = time.monotonic()
+
+        async def _run_stage(name: str, fn: StageFn, deps: Tuple[str, ...]) -> Any:
+            for d in deps:
+                await tasks[d]
+            t0 = time.monotonic()
+            out = await fn({d: results[d] for d in deps})
+            results[name] = out
+            self._log.info(
+                "Stage %s done in %dms (at +%dms)",
+                name,
+                int((time.monotonic() - t0) * 1000),
+                int((time.monotonic() - started_at) * 1000),
+            )
+            return out
+
+        for name, (fn, deps) in self._stages.items():
+            tasks[name] = asyncio.ensure_future(_run_stage(name, fn, deps))
+        try:
+            await asyncio.gather(*tasks.values())
+        finally:
+            for t in tasks.values():
+                t.cancel()
+        return results
@@ -0,0 +1,67 @@
+import logging
+import os
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+def lookup_path(result: Dict[str, Any], path: str) -> Any:
+    # Dotted path into a tool result, e.g. "raw_data.best_url"
+    value: Any = result
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+class ToolChain:
+    # Per-request produce -> consume fan-out. When a result yields a param (ToolSpec.produces) that other
+    # tools of the same stage take as input (ToolSpec.requires), those tools are started straight away.
+    # Each (param, value) triggers once; chains stop at `max_depth` hops and after `budget` chained calls.
+    # Triggered tools get the producer's params plus the produced one.
+    def __init__(self, registry: Any, stage: Optional[str], max_depth: Optional[int] = None, budget: Optional[int] = None):
+        self._registry = registry
+        self.stage = stage
+        self.max_depth = int(os.getenv("TOOL_CHAIN_MAX_DEPTH", "2")) if max_depth is None else max_depth
+        self.budget = int(os.getenv("TOOL_CHAIN_BUDGET", "6")) if budget is None else budget
+        self.spent = 0
+        self.produced: Dict[str, str] = {}  # first value seen per param
+        self._seen: Set[Tuple[str, str]] = set()
+        self._log = logging.getLogger(__name__)
+
+    def follow(self, result: Dict[str, Any], params: Dict[str, Any], depth: int = 0) -> List[Tuple[Any, Dict[str, Any], int, Dict[str, Any]]]:
+        # Calls triggered by a finished result: (tool, params, depth, chained_from)
+        producer = self._registry.get_tool((result.get("meta") or {}).get("tool") or "")
+        if producer is None or (result.get("raw_data") or {}).get("error"):
+            return []
+        calls = []
+        for param, path in producer.produces.items():
+            calls.extend(self.offer(param, lookup_path(result, path), params, depth, producer.name))
+        return calls
+
+    def offer(self, param: str, value: Any, params: Dict[str, Any], depth: int = 0, source: str = "") -> List[Tuple[Any, Dict[str, Any], int, Dict[str, Any]]]:
+        if not isinstance(value, str) or not value.strip():
+            return []
+        value = value.strip()
+        key = (param, value.lower())
+        if key in self._seen:
+            return []
+        self._seen.add(key)
+        self.produced.setdefault(param, value)
+        if depth >= self.max_depth:
+            self._log.info("Chain depth limit reached, not following %s from %s", param, source)
+            return []
+        call_params = dict(params)
+        call_params[param] = value
+        consumers = [t for t in self._registry.consumers_of(param, self.stage) if t.can_handle(call_params)]
+        consumers = self._registry.stats.select(consumers, call_params)[0]
+        calls = []
+        for tool in consumers:
+            if self.spent >= self.budget:
+                self._log.info("Chain budget exhausted, skipping %s(%s) from %s", tool.name, param, source)
+                break
+            self.spent += 1
+            calls.append((tool, call_params, depth + 1, {"tool": source, "param": param}))
+        return calls
+
+    def stats(self) -> Dict[str, Any]:
+        return {"spent": self.spent, "budget": self.budget, "max_depth": self.max_depth, "produced": dict(self.produced)}
@@ -0,0 +1,107 @@
+import json
+import os
+import random
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+_SHAPE_FIELDS = ("email", "phone", "username", "name", "location")
+
+
+def input_shape(params: Dict[str, Any]) -> str:
+    # e.g. "email", "phone", "name+location"; tools are judged separately per shape
+    present = [f for f in _SHAPE_FIELDS if params.get(f)]
+    return "+".join(present) or "empty"
+
+
+def collect_values(obj: Any) -> Set[str]:
+    # Lowercased string leaves of a candidate/profile (short tokens are too ambiguous to attribute)
+    if hasattr(obj, "model_dump"):
+        obj = obj.model_dump()
+    out: Set[str] = set()
+    if isinstance(obj, dict):
+        for v in obj.values():
+            out |= collect_values(v)
+    elif isinstance(obj, (list, tuple, set)):
+        for v in obj:
+            out |= collect_values(v)
+    elif isinstance(obj, str) and len(obj.strip()) >= 3:
+        out.add(obj.strip().lower())
+    return out
+
+
+class _Entry:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.latency_s = 0.0
+        self.contributions = 0
+
+    def value_per_second(self) -> float:
+        if not self.calls:
+            return 0.0
+        mean_latency = max(self.latency_s / self.calls, 0.05)
+        return (self.contributions / self.calls) / mean_latency
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "error_rate": round(self.errors / self.calls, 3) if self.calls else 0.0,
+            "mean_latency_ms": int(self.latency_s / self.calls * 1000) if self.calls else 0,
+            "contribution_rate": round(self.contributions / self.calls, 3) if self.calls else 0.0,
+            "value_per_s": round(self.value_per_second(), 4),
+        }
+
+
+class ToolStats:
+    # Per (tool, input shape): latency, error rate and how often the tool's evidence ended up in the
+    # final candidates/profile. TOOL_SELECTION_MODE=adaptive uses it to skip tools that rarely pay off.
+    def __init__(self) -> None:
+        self._entries: Dict[Tuple[str, str], _Entry] = {}
+        self.mode = os.getenv("TOOL_SELECTION_MODE", "all").lower()
+        self.min_value_per_s = float(os.getenv("TOOL_SELECTION_MIN_VALUE_PER_S", "0.01"))
+        self.min_samples = int(os.getenv("TOOL_SELECTION_MIN_SAMPLES", "20"))
+        self.explore_rate = float(os.getenv("TOOL_SELECTION_EXPLORE_RATE", "0.05"))
+
+    def _entry(self, tool: str, shape: str) -> _Entry:
+        return self._entries.setdefault((tool, shape), _Entry())
+
+    def record_call(self, tool: str, params: Dict[str, Any], latency_s: float, failed: bool) -> None:
+        entry = self._entry(tool, input_shape(params))
+        entry.calls += 1
+        entry.latency_s += latency_s
+        if failed:
+            entry.errors += 1
+
+    def record_contributions(self, results: Iterable[Dict[str, Any]], params: Dict[str, Any], final: Any) -> None:
+        # A result contributed if some value of the final output, not already given as input, appears in it.
+        # Cache hits and shared calls were not counted by record_call, so they are not credited either.
+        values = collect_values(final) - collect_values(params)
+        shape = input_shape(params)
+        for r in results:
+            meta = r.get("meta") or {}
+            tool = meta.get("tool")
+            if not tool or meta.get("cached") or meta.get("shared") or r.get("error") or (r.get("raw_data") or {}).get("error"):
+                continue
+            text = json.dumps(r.get("raw_data") or {}, default=str).lower()
+            if any(v in text for v in values):
+                self._entry(tool, shape).contributions += 1
+
+    def should_run(self, tool: str, params: Dict[str, Any]) -> bool:
+        if self.mode != "adaptive":
+            return True
+        entry = self._entries.get((tool, input_shape(params)))
+        if entry is None or entry.calls < self.min_samples:
+            return True
+        if entry.value_per_second() >= self.min_value_per_s:
+            return True
+        # Occasionally run a skipped tool anyway so its stats can recover
+        return random.random() < self.explore_rate
+
+    def snapshot(self) -> Dict[str, Any]:
+        by_tool: Dict[str, Dict[str, Any]] = {}
+        for (tool, shape), entry in sorted(self._entries.items()):
+            by_tool.setdefault(tool, {})[shape] = entry.as_dict()
+        return {"mode": self.mode, "min_value_per_s": self.min_value_per_s, "tools": by_tool}
+
+    def select(self, tools: List[Any], params: Dict[str, Any]) -> Tuple[List[Any], List[Any]]:
+        keep = [t for t in tools if self.should_run(t.name, params)]
+        return keep, [t for t in tools if t not in keep]
@@ -0,0 +1,73 @@
+import asyncio
+import time
+
+import httpx
+import requests
+
+from services import http
+from tools.ghunt import GHuntTool
+from tools.github import GitHubTool
+from tools.github_extras import GitHubExtrasTool
+from tools.linkedin_verify import LinkedInVerifyTool
+from tools.x_verify import XVerifyTool
+
+# Every upstream answers after this long; a tool that blocks the loop stalls the heartbeat just as long
+RESPONSE_DELAY_S = 0.3
+MAX_LOOP_LAG_S = 0.1
+
+
+async def _slow_upstream(request: httpx.Request) -> httpx.Response:
+    await asyncio.sleep(RESPONSE_DELAY_S)
+    return httpx.Response(200, text="<html></html>", request=request)
+
+
+def _blocking_request(*args, **kwargs):
+    # Stands in for any synchronous HTTP call that sneaks back into a tool
+    time.sleep(RESPONSE_DELAY_S)
+    raise requests.ConnectionError("blocking call")
+
+
+async def _max_loop_lag(make_work) -> float:
+    lag = 0.0
+    done = False
+
+    async def heartbeat() -> None:
+        nonlocal lag
+        while not done:
+            t0 = time.perf_counter()
+            await asyncio.sleep(0.01)
+            lag = max(lag, time.perf_counter() - t0 - 0.01)
+
+    beat = asyncio.ensure_future(heartbeat())
+    await asyncio.sleep(0.05)  # heartbeat is ticking before any tool starts
+    try:
+        await make_work()
+    finally:
+        done = True
+        await beat
+    return lag
+
+
+def test_tools_do_not_block_event_loop(monkeypatch):
+    monkeypatch.setattr(requests.Session, "request", _blocking_request)
+    monkeypatch.setenv("SCRAPINGDOG_API_KEY", "test")
+    monkeypatch.setenv("LINKEDIN_VERIFY_ENABLE", "true")
+    monkeypatch.setenv("X_VERIFY_ENABLE", "true")
+    params = {
+        "username": "octocat",
+        "email": "octocat@gmail.com",
+        "linkedin_finder_best_url": "https://www.linkedin.com/in/octocat",
+        "x_finder_best_url": "https://x.com/octocat",
+    }
+    tools = [GitHubTool(), GitHubExtrasTool(), GHuntTool(), LinkedInVerifyTool(), XVerifyTool()]
+
+    async def run() -> float:
+        http.set_client(httpx.AsyncClient(transport=httpx.MockTransport(_slow_upstream)))
+        try:
+            # Several concurrent rounds: a blocking tool would serialize them and stall the loop each time
+            return await _max_loop_lag(lambda: asyncio.gather(*(t.execute(params) for _ in range(3) for t in tools)))
+        finally:
+            await http.aclose()
+
+    lag = asyncio.run(run())
+    assert lag < MAX_LOOP_LAG_S, f"event loop blocked for {lag:.3f}s"
@@ -1,17 +1,24 @@
-from .github import GitHubTool
-from .numverify import NumverifyTool
-from .registry import ToolRegistry
-from .espy.email import EspyEmailTool
-from .espy.phone import EspyPhoneTool
-from .espy.name import EspyNameTool
-from .espy.deepweb import EspyDeepwebTool
+import importlib
+from typing import Any
 
-__all__ = [
-    "ToolRegistry",
-    "GitHubTool",
-    "NumverifyTool",
-    "EspyEmailTool",
-    "EspyPhoneTool",
-    "EspyNameTool",
-    "EspyDeepwebTool",
-]
+# Exports resolve on first access so `import tools` (or tools.base) doesn't import every tool module
+_EXPORTS = {
+    "ToolRegistry": ".registry",
+    "GitHubTool": ".github",
+    "NumverifyTool": ".numverify",
+    "EspyEmailTool": ".espy.email",
+    "EspyPhoneTool": ".espy.phone",
+    "EspyNameTool": ".espy.name",
+    "EspyDeepwebTool": ".espy.deepweb",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,8 +1,31 @@
+import json
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 
 
 class BaseTool(ABC):
+    # Params computed by the shallow pre-steps (e.g. "mkt", "search_hint") this tool should wait for
+    waits_for: Tuple[str, ...] = ()
+    # Capability metadata; registered tools get these from their ToolSpec (empty requires = always ask can_handle)
+    requires: Tuple[Tuple[str, ...], ...] = ()
+    produces: Dict[str, str] = {}
+    # Params that fully determine the tool's output; identical calls can then be shared (empty = never)
+    key_params: Tuple[str, ...] = ()
+    # Concurrency bulkhead: max concurrent executions and max callers queued for a slot (0 = unbounded)
+    max_inflight: int = 0
+    max_queue: int = 0
+    # Execution policy applied by the registry: per-attempt timeout (None = TOOL_DEFAULT_TIMEOUT_S, 0 = none),
+    # retries on exceptions/timeouts, retries on transient error results (opt-in), hedging after the observed p95
+    timeout_s: Optional[float] = None
+    retries: int = 0
+    retry_on_error: bool = False
+    hedge: bool = False
+    # External provider behind this tool; tools sharing a provider share one circuit breaker (None = no breaker)
+    provider: Optional[str] = None
+    # Result cache TTLs in seconds, keyed by call_key (0 = not cached); negative answers use the shorter TTL
+    cache_ttl_s: float = 0.0
+    negative_cache_ttl_s: float = 0.0
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -20,3 +43,21 @@ class BaseTool(ABC):
     @abstractmethod
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         pass
+
+    def is_negative(self, result: Dict[str, Any]) -> bool:
+        # True when the tool answered "nothing found" (cached for negative_cache_ttl_s)
+        return False
+
+    def call_key(self, params: Dict[str, Any]) -> Optional[str]:
+        if not self.key_params:
+            return None
+        values: Dict[str, Any] = {}
+        for k in self.key_params:
+            v = params.get(k)
+            if isinstance(v, str):
+                v = v.strip().lower() if k in ("email", "username") else v.strip()
+            elif isinstance(v, list):
+                v = sorted(str(x) for x in v)
+            values[k] = v
+        return f"{self.name}:{json.dumps(values, sort_keys=True, default=str)}"
+
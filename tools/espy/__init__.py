@@ -1,13 +1,21 @@
-from .email import EspyEmailTool
-from .phone import EspyPhoneTool
-from .name import EspyNameTool
-from .deepweb import EspyDeepwebTool
+import importlib
+from typing import Any
 
-__all__ = [
-    "EspyEmailTool",
-    "EspyPhoneTool",
-    "EspyNameTool",
-    "EspyDeepwebTool",
-]
+# Lazy exports: importing tools.espy.client must not pull in every ESPY tool
+_EXPORTS = {
+    "EspyEmailTool": ".email",
+    "EspyPhoneTool": ".phone",
+    "EspyNameTool": ".name",
+    "EspyDeepwebTool": ".deepweb",
+}
 
+__all__ = list(_EXPORTS)
 
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -4,6 +4,8 @@ import httpx
 import asyncio
 import logging
 from typing import Any, Dict, Optional, List, Tuple
+from services.circuit import CircuitOpen, get_breaker
+from services.http import get_client
 
 BASE_URL = "https://irbis.espysys.com/api"
 
@@ -24,18 +26,21 @@ class EspyClient:
         }
 
     async def _post(self, endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        async with httpx.AsyncClient(timeout=30) as client:
+        async def _call() -> Dict[str, Any]:
             ep = self._normalize_endpoint(endpoint)
-            r = await client.post(f"{BASE_URL}{ep}", json=payload)
+            r = await get_client().post(f"{BASE_URL}{ep}", json=payload, timeout=30)
             r.raise_for_status()
             return r.json()
+        # Raises CircuitOpen while ESPY is failing; lookups report it as their error
+        return await get_breaker("espy").call(_call)
 
     async def _get(self, endpoint: str) -> Dict[str, Any]:
-        async with httpx.AsyncClient(timeout=30) as client:
+        async def _call() -> Dict[str, Any]:
             ep = self._normalize_endpoint(endpoint)
-            r = await client.get(f"{BASE_URL}{ep}")
+            r = await get_client().get(f"{BASE_URL}{ep}", timeout=30)
             r.raise_for_status()
             return r.json()
+        return await get_breaker("espy").call(_call)
 
     def _normalize_endpoint(self, endpoint: str) -> str:
         if endpoint.startswith("/api/"):
@@ -123,6 +128,9 @@ class EspyClient:
         except httpx.HTTPStatusError as e:
             self._log.error("ESPY HTTP error %s: %s", e.response.status_code, e.response.text[:200])
             return {"error": f"HTTP error during ESPY lookup: {e.response.status_code}", "details": e.response.text}
+        except CircuitOpen:
+            self._log.warning("ESPY circuit open; skipping lookup")
+            return {"error": "circuit_open", "provider": "espy"}
         except Exception as e:
             self._log.exception("ESPY unexpected error during lookup")
             return {"error": f"An unexpected error occurred during ESPY lookup: {str(e)}"}
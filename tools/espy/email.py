@@ -4,6 +4,10 @@ from .client import EspyClient
 
 
 class EspyEmailTool(BaseTool):
+    key_params = ("email",)
+    timeout_s = 120
+    cache_ttl_s = 86400
+
     @property
     def name(self) -> str:
         return "espy_email"
@@ -3,6 +3,10 @@ from ..base import BaseTool
 from .client import EspyClient
 
 class EspyNameTool(BaseTool):
+    key_params = ("name",)
+    timeout_s = 120
+    cache_ttl_s = 86400
+
     @property
     def name(self) -> str:
         return "espy_name"
@@ -16,7 +20,7 @@ class EspyNameTool(BaseTool):
 
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         name = params["name"]
-        client = _CLIENT
+        client = EspyClient()
         print(f"TOOL: ESPY Name lookup for {name}...")
         result = await client.run_lookup(
             endpoint="/developer/combined_name",
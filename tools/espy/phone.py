@@ -3,6 +3,10 @@ from ..base import BaseTool
 from .client import EspyClient
 
 class EspyPhoneTool(BaseTool):
+    key_params = ("phone",)
+    timeout_s = 120
+    cache_ttl_s = 86400
+
     @property
     def name(self) -> str:
         return "espy_phone"
@@ -1,9 +1,9 @@
 import re
 import html as _html
-import requests
 from datetime import datetime, timezone
 from typing import Dict, Any
 
+from services.http import error_fields, get_client
 from .base import BaseTool
 
 
@@ -11,6 +11,16 @@ _PROVIDER_BASE = "https://gmail-osint.activetk.jp"
 
 
 class GHuntTool(BaseTool):
+    key_params = ("email",)
+    max_inflight = 4
+    max_queue = 32
+    timeout_s = 15
+    retries = 1
+    retry_on_error = True
+    provider = "gmail-osint"
+    cache_ttl_s = 3600
+    negative_cache_ttl_s = 600
+
     @property
     def name(self) -> str:
         return "GHunt"
@@ -23,6 +33,9 @@ class GHuntTool(BaseTool):
         email = (params.get("email") or "").strip().lower()
         return bool(email.endswith("@gmail.com"))
 
+    def is_negative(self, result: Dict[str, Any]) -> bool:
+        return (result.get("raw_data") or {}).get("google_account") is False
+
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         email: str = (params.get("email") or "").strip().lower()
         try:
@@ -34,11 +47,14 @@ class GHuntTool(BaseTool):
 
         url = f"{_PROVIDER_BASE}/{local_part}"
         try:
-            resp = requests.get(url, timeout=10)
+            resp = await get_client().get(url, timeout=10)
+            if resp.status_code == 404:
+                # The provider answers 404 for addresses without a Google account: an answer, not an error
+                return {"source": "GHunt", "raw_data": {"email": email, "google_account": False}}
             resp.raise_for_status()
             html = resp.text
         except Exception as e:
-            return {"source": "GHunt", "raw_data": {"error": str(e)}}
+            return {"source": "GHunt", "raw_data": error_fields(e)}
 
         profile_image_url = _extract_profile_image_url(html)
         gaia_id = _extract_gaia_id(html)
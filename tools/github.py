@@ -1,9 +1,17 @@
 from typing import Dict, Any
-from scraper import scrape_github_profile
+from scraper import fetch_github_profile
 from .base import BaseTool
 
 
 class GitHubTool(BaseTool):
+    key_params = ("username",)
+    timeout_s = 15
+    retries = 1
+    retry_on_error = True
+    provider = "github"
+    cache_ttl_s = 3600
+    negative_cache_ttl_s = 600
+
     @property
     def name(self) -> str:
         return "github"
@@ -15,13 +23,21 @@ class GitHubTool(BaseTool):
     def can_handle(self, params: Dict[str, Any]) -> bool:
         return bool(params.get("username"))
 
+    def is_negative(self, result: Dict[str, Any]) -> bool:
+        # Only a 404 means the user does not exist; fetch failures are errors (retried, never cached)
+        return (result.get("raw_data") or {}).get("found") is False
+
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         username = params.get("username")
         print(f"TOOL: Scraping GitHub for {username}…")
-        profile = scrape_github_profile(username)
+        parsed = await fetch_github_profile(username)
+        if parsed.get("error"):
+            return {"source": "GitHub", "raw_data": {"error": parsed["error"], "transient": parsed.get("transient", False), "username": username}}
+        if parsed.get("not_found"):
+            return {"source": "GitHub", "raw_data": {"found": False}}
         return {
             "source": "GitHub",
-            "raw_data": profile.model_dump(),
+            "raw_data": dict(parsed["profile"]),
         }
 
 
@@ -19,6 +19,13 @@ def _extract_marker(line: str) -> Optional[Tuple[str, str]]:
     return m.group(1), m.group(2).strip()
 
 class HoleheCliTool(BaseTool):
+    key_params = ("email",)
+    max_inflight = 4
+    max_queue = 32
+    timeout_s = 75
+    cache_ttl_s = 43200
+    negative_cache_ttl_s = 3600
+
     @property
     def name(self) -> str:
         return "holehe_cli"
@@ -30,6 +37,11 @@ class HoleheCliTool(BaseTool):
     def can_handle(self, params: Dict[str, Any]) -> bool:
         return bool(params.get("email"))
 
+    def is_negative(self, result: Dict[str, Any]) -> bool:
+        # No accounts found, or a partial run (rate limits / non-zero exit) that is worth retrying sooner
+        data = result.get("raw_data") or {}
+        return not data.get("error") and (not data.get("used_service_ids") or bool(data.get("rate_limited_service_ids")) or bool(data.get("warning")))
+
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         email = params["email"]
         timeout = int(os.getenv("HOLEHE_CLI_TIMEOUT", "60"))
@@ -56,6 +68,12 @@ class HoleheCliTool(BaseTool):
                 )
                 try:
                     stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+                except asyncio.CancelledError:
+                    # Request deadline hit: kill the CLI and reap it so no zombie or open transport is left behind
+                    if proc.returncode is None:
+                        proc.kill()
+                    await asyncio.shield(proc.wait())
+                    raise
                 except asyncio.TimeoutError:
                     proc.kill()
                     await proc.wait()
@@ -45,6 +45,10 @@ def _run_trio(email: str, funcs: List[Callable], timeout_ms: int, retries: int)
     return trio.run(_main)
 
 class HoleheResolverTool(BaseTool):
+    key_params = ("email", "used_service_ids", "used_services")
+    timeout_s = 60
+    cache_ttl_s = 21600
+
     @property
     def name(self) -> str:
         return "holehe_resolver"
@@ -3,11 +3,19 @@ import asyncio
 import time
 from typing import Dict, Any, List, Optional
 
+from services.policy import is_transient_error
 from ..base import BaseTool
 from .client import HyperbrowserClient
 
 
 class HyperbrowserCrawlTool(BaseTool):
+    key_params = ("hyperbrowser",)
+    max_inflight = 2
+    max_queue = 8
+    timeout_s = 100
+    provider = "hyperbrowser"
+    cache_ttl_s = 3600
+
     @property
     def name(self) -> str:
         return "hyperbrowser_crawl"
@@ -99,13 +107,13 @@ class HyperbrowserCrawlTool(BaseTool):
         except asyncio.TimeoutError:
             return {
                 "source": "Hyperbrowser-Crawl",
-                "raw_data": {"error": "timeout"},
+                "raw_data": {"error": "timeout", "transient": True},
                 "meta": {"urls": [url]},
             }
         except Exception as e:
             return {
                 "source": "Hyperbrowser-Crawl",
-                "raw_data": {"error": str(e)},
+                "raw_data": {"error": str(e), "transient": is_transient_error(e)},
                 "meta": {"urls": [url]},
             }
 
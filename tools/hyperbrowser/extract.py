@@ -3,12 +3,20 @@ import asyncio
 import time
 from typing import Dict, Any, List, Optional
 
+from services.policy import is_transient_error
 from ..base import BaseTool
 from .client import HyperbrowserClient
 from schemas import HyperbrowserParams
 
 
 class HyperbrowserExtractTool(BaseTool):
+    key_params = ("hyperbrowser",)
+    max_inflight = 3
+    max_queue = 16
+    timeout_s = 100
+    provider = "hyperbrowser"
+    cache_ttl_s = 3600
+
     @property
     def name(self) -> str:
         return "hyperbrowser_extract"
@@ -96,13 +104,13 @@ class HyperbrowserExtractTool(BaseTool):
         except asyncio.TimeoutError:
             return {
                 "source": "Hyperbrowser-Extract",
-                "raw_data": {"error": "timeout"},
+                "raw_data": {"error": "timeout", "transient": True},
                 "meta": {"urls": urls},
             }
         except Exception as e:
             return {
                 "source": "Hyperbrowser-Extract",
-                "raw_data": {"error": str(e)},
+                "raw_data": {"error": str(e), "transient": is_transient_error(e)},
                 "meta": {"urls": urls},
             }
 
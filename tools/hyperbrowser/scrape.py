@@ -3,11 +3,19 @@ import asyncio
 import time
 from typing import Dict, Any, List, Optional
 
+from services.policy import is_transient_error
 from ..base import BaseTool
 from .client import HyperbrowserClient
 
 
 class HyperbrowserScrapeTool(BaseTool):
+    key_params = ("hyperbrowser", "website_url")
+    max_inflight = 3
+    max_queue = 16
+    timeout_s = 40
+    provider = "hyperbrowser"
+    cache_ttl_s = 3600
+
     @property
     def name(self) -> str:
         return "hyperbrowser_scrape"
@@ -19,14 +27,20 @@ class HyperbrowserScrapeTool(BaseTool):
     def _enabled(self) -> bool:
         return os.getenv("HYPERBROWSER_ENABLE_SCRAPE", "true").lower() == "true"
 
+    def _scrape_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        # Explicit hyperbrowser.scrape request, else a website chained from another tool (e.g. GitHub-Extras)
+        hb: Optional[Dict[str, Any]] = params.get("hyperbrowser")
+        if hb and isinstance(hb, dict) and (hb.get("scrape") or {}).get("urls"):
+            return hb["scrape"]
+        website = params.get("website_url")
+        if isinstance(website, str) and website.startswith(("http://", "https://")):
+            return {"urls": [website], "formats": ["markdown"], "only_main_content": True}
+        return {}
+
     def can_handle(self, params: Dict[str, Any]) -> bool:
         if not self._enabled():
             return False
-        hb: Optional[Dict[str, Any]] = params.get("hyperbrowser")
-        if not hb or not isinstance(hb, dict):
-            return False
-        scrape = hb.get("scrape") or {}
-        urls: Optional[List[str]] = scrape.get("urls")
+        urls: Optional[List[str]] = self._scrape_params(params).get("urls")
         return bool(urls)
 
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -35,7 +49,7 @@ class HyperbrowserScrapeTool(BaseTool):
             return {"source": "Hyperbrowser-Scrape", "raw_data": {"error": "API key not configured"}}
 
         hb: Dict[str, Any] = params.get("hyperbrowser") or {}
-        p: Dict[str, Any] = hb.get("scrape") or {}
+        p: Dict[str, Any] = self._scrape_params(params)
 
         urls: List[str] = p.get("urls") or []
         formats: Optional[List[str]] = p.get("formats")
@@ -114,13 +128,13 @@ class HyperbrowserScrapeTool(BaseTool):
         except asyncio.TimeoutError:
             return {
                 "source": "Hyperbrowser-Scrape",
-                "raw_data": {"error": "timeout"},
+                "raw_data": {"error": "timeout", "transient": True},
                 "meta": {"urls": urls},
             }
         except Exception as e:
             return {
                 "source": "Hyperbrowser-Scrape",
-                "raw_data": {"error": str(e)},
+                "raw_data": {"error": str(e), "transient": is_transient_error(e)},
                 "meta": {"urls": urls},
             }
 
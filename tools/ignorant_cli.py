@@ -35,6 +35,13 @@ def _split_phone(e164: str) -> Optional[Tuple[str, str]]:
 
 
 class IgnorantCliTool(BaseTool):
+    key_params = ("phone",)
+    max_inflight = 4
+    max_queue = 32
+    timeout_s = 75
+    cache_ttl_s = 43200
+    negative_cache_ttl_s = 3600
+
     @property
     def name(self) -> str:
         return "ignorant_cli"
@@ -46,6 +53,10 @@ class IgnorantCliTool(BaseTool):
     def can_handle(self, params: Dict[str, Any]) -> bool:
         return bool(params.get("phone"))
 
+    def is_negative(self, result: Dict[str, Any]) -> bool:
+        data = result.get("raw_data") or {}
+        return not data.get("error") and (not data.get("used_service_ids") or bool(data.get("rate_limited_service_ids")) or bool(data.get("warning")))
+
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         raw_phone = (params.get("phone") or "").strip()
         try:
@@ -82,6 +93,12 @@ class IgnorantCliTool(BaseTool):
                 )
                 try:
                     stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+                except asyncio.CancelledError:
+                    # Request deadline hit: kill the CLI and reap it so no zombie or open transport is left behind
+                    if proc.returncode is None:
+                        proc.kill()
+                    await asyncio.shield(proc.wait())
+                    raise
                 except asyncio.TimeoutError:
                     proc.kill()
                     await proc.wait()
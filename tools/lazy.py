@@ -0,0 +1,97 @@
+import importlib
+import logging
+import os
+from typing import Any, Dict, Optional, Tuple
+
+from .base import BaseTool
+
+
+class ToolSpec:
+    # Declarative registry entry. The tool's module is only imported when the tool is first used, so
+    # everything needed to index, chain or describe a tool lives here:
+    #   requires: alternative sets of input params, any one of which makes the tool a candidate
+    #             (can_handle still has the final say, e.g. gmail-only or US-only rules)
+    #   produces: params this tool yields for other tools -> dotted path into its result
+    #   cost / latency: coarse classes ("free" | "low" | "high", "fast" | "medium" | "slow")
+    #   description / planner_params: planner manifest entry (params default to the first requires set)
+    def __init__(
+        self,
+        name: str,
+        stage: str,
+        target: str,
+        enable_env: Optional[str] = None,
+        enabled_by_default: bool = True,
+        requires: Tuple[Tuple[str, ...], ...] = (),
+        produces: Optional[Dict[str, str]] = None,
+        cost: str = "low",
+        latency: str = "medium",
+        description: str = "",
+        planner_params: Optional[Dict[str, Any]] = None,
+    ):
+        self.name = name
+        self.stage = stage
+        self.target = target  # "package.module:ClassName"
+        self.enable_env = enable_env
+        self.enabled_by_default = enabled_by_default
+        self.requires = requires
+        self.produces = produces or {}
+        self.cost = cost
+        self.latency = latency
+        self.description = description
+        self.planner_params = planner_params
+
+    def enabled(self) -> bool:
+        if not self.enable_env:
+            return True
+        return os.getenv(self.enable_env, "true" if self.enabled_by_default else "false").lower() == "true"
+
+    def manifest_entry(self) -> Dict[str, Any]:
+        params = self.planner_params
+        if params is None:
+            required = list(self.requires[0]) if self.requires else []
+            params = {"type": "OBJECT", "properties": {k: {"type": "STRING"} for k in required}, "required": required}
+        return {"name": self.name, "description": f"{self.description} (cost: {self.cost}, latency: {self.latency})", "parameters": params}
+
+
+class LazyTool:
+    # Stands in for a tool until first use. name/stage come from the spec, so listing or filtering
+    # tools by stage imports nothing; any other attribute (can_handle, execute, key_params...) loads it.
+    def __init__(self, spec: ToolSpec):
+        self._spec = spec
+        self._tool: Optional[BaseTool] = None
+
+    @property
+    def name(self) -> str:
+        return self._spec.name
+
+    @property
+    def stage(self) -> str:
+        return self._spec.stage
+
+    @property
+    def requires(self) -> Tuple[Tuple[str, ...], ...]:
+        return self._spec.requires
+
+    @property
+    def produces(self) -> Dict[str, str]:
+        return self._spec.produces
+
+    @property
+    def loaded(self) -> bool:
+        return self._tool is not None
+
+    def load(self) -> BaseTool:
+        if self._tool is None:
+            module_path, _, class_name = self._spec.target.partition(":")
+            tool = getattr(importlib.import_module(module_path), class_name)()
+            if tool.name != self._spec.name or tool.stage != self._spec.stage:
+                logging.getLogger(__name__).warning(
+                    "Tool spec %s/%s does not match %s (%s/%s)", self._spec.name, self._spec.stage, self._spec.target, tool.name, tool.stage
+                )
+            self._tool = tool
+        return self._tool
+
+    def __getattr__(self, attr: str) -> Any:
+        if attr.startswith("__") or attr in ("_spec", "_tool"):
+            raise AttributeError(attr)
+        return getattr(self.load(), attr)
@@ -1,11 +1,19 @@
 import os
 from typing import Dict, Any
-import requests
-from bs4 import BeautifulSoup
+from services.http import error_fields, get_client
+from services.parsing import make_soup, parse_off_loop, strainer
 from .base import BaseTool
 
+# Rendered profiles run to hundreds of KB; only the top-card pieces read below are built into a tree
+_TOP_CARD = strainer(tags=("h1", "span", "img"), classes=("text-body-medium",))
+
 
 class LinkedInVerifyTool(BaseTool):
+    key_params = ("linkedin_finder_best_url", "country")
+    timeout_s = 35
+    provider = "scrapingdog"
+    cache_ttl_s = 21600
+
     @property
     def name(self) -> str:
         return "linkedin_verify"
@@ -31,7 +39,7 @@ class LinkedInVerifyTool(BaseTool):
         timeout_s = int(os.getenv("LINKEDIN_VERIFY_TIMEOUT_S", "30"))
         country = (params.get("country") or os.getenv("LINKEDIN_VERIFY_COUNTRY", "US"))
         try:
-            r = requests.get(
+            r = await get_client().get(
                 "https://api.scrapingdog.com/scrape",
                 params={
                     "api_key": api_key,
@@ -45,25 +53,19 @@ class LinkedInVerifyTool(BaseTool):
             r.raise_for_status()
             html = r.text
         except Exception as e:
-            return {"source": "LinkedIn-Verify", "raw_data": {"error": str(e), "url": url}}
+            return {"source": "LinkedIn-Verify", "raw_data": {**error_fields(e), "url": url}}
 
-        soup = BeautifulSoup(html, "html.parser")
-        name = self._text(soup.select_one("h1"))
-        headline = self._text(soup.select_one("div.text-body-medium"))
-        location = self._guess_location(soup)
-        company = self._guess_company(soup)
-        photo = self._guess_photo(soup)
+        return {"source": "LinkedIn-Verify", "raw_data": await parse_off_loop(self._parse, html, url)}
 
+    def _parse(self, html: str, url: str) -> Dict[str, Any]:
+        soup = make_soup(html, parse_only=_TOP_CARD)
         return {
-            "source": "LinkedIn-Verify",
-            "raw_data": {
-                "url": url,
-                "name": name,
-                "headline": headline,
-                "location": location,
-                "company": company,
-                "photo": photo,
-            },
+            "url": url,
+            "name": self._text(soup.select_one("h1")),
+            "headline": self._text(soup.select_one("div.text-body-medium")),
+            "location": self._guess_location(soup),
+            "company": self._guess_company(soup),
+            "photo": self._guess_photo(soup),
         }
 
     def _text(self, el) -> str:
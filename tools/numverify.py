@@ -1,10 +1,18 @@
 import os
-import httpx
 from typing import Dict, Any
+from services.http import error_fields, get_client
 from .base import BaseTool
 
 
 class NumverifyTool(BaseTool):
+    key_params = ("phone",)
+    timeout_s = 15
+    retries = 1
+    retry_on_error = True
+    hedge = True
+    provider = "numverify"
+    cache_ttl_s = 86400
+
     @property
     def name(self) -> str:
         return "numverify"
@@ -25,12 +33,11 @@ class NumverifyTool(BaseTool):
 
         url = f"http://apilayer.net/api/validate?access_key={api_key}&number={phone_number}"
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                resp = await client.get(url)
-                resp.raise_for_status()
-                return {"source": "Numverify", "raw_data": resp.json()}
+            resp = await get_client().get(url, timeout=10)
+            resp.raise_for_status()
+            return {"source": "Numverify", "raw_data": resp.json()}
         except Exception as e:
-            return {"source": "Numverify", "raw_data": {"error": str(e)}}
+            return {"source": "Numverify", "raw_data": error_fields(e)}
 
 
 async def get_phone_number_info(phone_number: str) -> dict:
@@ -1,75 +1,479 @@
 import asyncio
+import contextlib
+import json
 import logging
 import os
-from typing import List, Dict, Any, Optional
+import re
+import time
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import List, Dict, Any, FrozenSet, Optional, AsyncIterator, Iterator, Tuple
 from .base import BaseTool
-from .github import GitHubTool
-from .numverify import NumverifyTool
-from .holehe_cli import HoleheCliTool
-from .holehe_resolver import HoleheResolverTool
-from .hyperbrowser.extract import HyperbrowserExtractTool
-from .hyperbrowser.scrape import HyperbrowserScrapeTool
-from .hyperbrowser.crawl import HyperbrowserCrawlTool
-from .ghunt import GHuntTool
-from .ignorant_cli import IgnorantCliTool
-from .github_extras import GitHubExtrasTool
-from .linkedin_finder import LinkedInFinderTool
-from .linkedin_verify import LinkedInVerifyTool
-from .x_finder import XFinderTool
-from .x_verify import XVerifyTool
-from .espy.email import EspyEmailTool
-from .espy.court_records import EspyCourtRecordsTool
-from .espy.phone import EspyPhoneTool
-from .espy.name import EspyNameTool
-from .espy.deepweb import EspyDeepwebTool
+from .lazy import LazyTool, ToolSpec
+from services.bulkhead import Bulkhead, BulkheadFull
+from services.cache import build_cache
+from services.circuit import CircuitOpen, get_breaker
+from services.deadline import current_deadline, within_deadline
+from services.policy import ExecutionPolicy, LatencyWindow, is_transient_result, result_error
+from services.tool_chain import ToolChain
+from services.tool_stats import ToolStats
+
+# Registry order is execution/report order. Modules are imported on first use, and tools whose
+# enable flag is off are never imported at all. Selection, chaining and the planner manifest are
+# driven by the metadata here, so none of them needs to import a tool.
+_EMAIL = (("email",),)
+_PHONE = (("phone",),)
+_USERNAME = (("username",),)
+_HYPERBROWSER = (("hyperbrowser",),)
+
+_TOOL_SPECS: List[ToolSpec] = [
+    ToolSpec(
+        "github", "shallow", "tools.github:GitHubTool",
+        requires=_USERNAME, cost="free", latency="medium",
+        description="Scrape GitHub by username.",
+    ),
+    ToolSpec(
+        "github_extras", "shallow", "tools.github_extras:GitHubExtrasTool", "GITHUB_EXTRAS_ENABLE", True,
+        requires=_USERNAME, cost="free", latency="medium",
+        produces={
+            "linkedin_finder_best_url": "raw_data.linkedin",
+            "x_finder_best_url": "raw_data.twitter_url",
+            "website_url": "raw_data.website",
+        },
+    ),
+    ToolSpec(
+        "linkedin_finder", "shallow", "tools.linkedin_finder:LinkedInFinderTool", "LINKEDIN_FINDER_ENABLE", False,
+        requires=(("name",),), produces={"linkedin_finder_best_url": "raw_data.best_url"}, cost="low", latency="medium",
+    ),
+    ToolSpec(
+        "linkedin_verify", "shallow", "tools.linkedin_verify:LinkedInVerifyTool", "LINKEDIN_VERIFY_ENABLE", False,
+        requires=(("linkedin_finder_best_url",),), cost="low", latency="slow",
+    ),
+    ToolSpec(
+        "x_finder", "shallow", "tools.x_finder:XFinderTool", "X_FINDER_ENABLE", False,
+        requires=(("name",), ("username",)), produces={"x_finder_best_url": "raw_data.best_url"}, cost="low", latency="medium",
+    ),
+    ToolSpec(
+        "x_verify", "shallow", "tools.x_verify:XVerifyTool", "X_VERIFY_ENABLE", False,
+        requires=(("x_finder_best_url",),), cost="low", latency="medium",
+    ),
+    ToolSpec(
+        "numverify", "shallow", "tools.numverify:NumverifyTool",
+        requires=_PHONE, cost="low", latency="fast",
+        description="Validate phone format and metadata.",
+    ),
+    ToolSpec(
+        "holehe_cli", "shallow", "tools.holehe_cli:HoleheCliTool",
+        requires=_EMAIL, cost="free", latency="slow",
+        description="Discover services linked to an email.",
+    ),
+    ToolSpec(
+        "holehe_resolver", "deep", "tools.holehe_resolver:HoleheResolverTool",
+        requires=_EMAIL, cost="free", latency="slow",
+    ),
+    ToolSpec(
+        "GHunt", "shallow", "tools.ghunt:GHuntTool",
+        requires=_EMAIL, cost="free", latency="medium",
+    ),
+    ToolSpec(
+        "ignorant_cli", "shallow", "tools.ignorant_cli:IgnorantCliTool",
+        requires=_PHONE, cost="free", latency="slow",
+    ),
+    ToolSpec(
+        "hyperbrowser_extract", "deep", "tools.hyperbrowser.extract:HyperbrowserExtractTool",
+        requires=_HYPERBROWSER, cost="high", latency="slow",
+        description="Extract structured data from URLs via schema or prompt.",
+        planner_params={
+            "type": "OBJECT",
+            "properties": {
+                "urls": {"type": "ARRAY", "items": {"type": "STRING"}},
+                "schema": {"type": "OBJECT"},
+                "prompt": {"type": "STRING"},
+                "max_links": {"type": "NUMBER"},
+            },
+            "required": ["urls"],
+        },
+    ),
+    ToolSpec(
+        "hyperbrowser_scrape", "deep", "tools.hyperbrowser.scrape:HyperbrowserScrapeTool",
+        requires=_HYPERBROWSER + (("website_url",),), cost="high", latency="slow",
+        description="Fetch content for one or many URLs; prefer formats ['markdown','links'] and only_main_content=true.",
+        planner_params={
+            "type": "OBJECT",
+            "properties": {
+                "urls": {"type": "ARRAY", "items": {"type": "STRING"}},
+                "formats": {"type": "ARRAY", "items": {"type": "STRING"}},
+                "only_main_content": {"type": "BOOLEAN"},
+                "timeout_ms": {"type": "NUMBER"},
+            },
+            "required": ["urls"],
+        },
+    ),
+    ToolSpec(
+        "hyperbrowser_crawl", "deep", "tools.hyperbrowser.crawl:HyperbrowserCrawlTool",
+        requires=_HYPERBROWSER, cost="high", latency="slow",
+        description="Constrained crawl of a site to a small number of pages.",
+        planner_params={
+            "type": "OBJECT",
+            "properties": {
+                "url": {"type": "STRING"},
+                "max_pages": {"type": "NUMBER"},
+                "include_patterns": {"type": "ARRAY", "items": {"type": "STRING"}},
+                "exclude_patterns": {"type": "ARRAY", "items": {"type": "STRING"}},
+                "formats": {"type": "ARRAY", "items": {"type": "STRING"}},
+                "only_main_content": {"type": "BOOLEAN"},
+                "timeout_ms": {"type": "NUMBER"},
+            },
+            "required": ["url"],
+        },
+    ),
+    # ESPY is disabled by default for cost; the planner only sees it when ESPY_ENABLE=true
+    ToolSpec(
+        "espy_email", "deep", "tools.espy.email:EspyEmailTool", "ESPY_ENABLE", False,
+        requires=_EMAIL, cost="high", latency="slow",
+    ),
+    ToolSpec(
+        "espy_court_records", "deep", "tools.espy.court_records:EspyCourtRecordsTool", "ESPY_ENABLE", False,
+        requires=(("name", "country"),), cost="high", latency="slow",
+    ),
+    ToolSpec(
+        "espy_phone", "deep", "tools.espy.phone:EspyPhoneTool", "ESPY_ENABLE", False,
+        requires=_PHONE, cost="high", latency="slow",
+        description="High-cost phone enrichment; use only after strong identity match.",
+    ),
+    ToolSpec(
+        "espy_name", "deep", "tools.espy.name:EspyNameTool", "ESPY_ENABLE", False,
+        requires=(("name",),), cost="high", latency="slow",
+    ),
+    ToolSpec(
+        "espy_deepweb", "deep", "tools.espy.deepweb:EspyDeepwebTool", "ESPY_ENABLE", False,
+        requires=(("email",), ("phone",)), cost="high", latency="slow",
+    ),
+]
+
+
+@lru_cache(maxsize=8)
+def _manifest_json(enabled: Tuple[str, ...]) -> str:
+    specs = [spec for spec in _TOOL_SPECS if spec.name in enabled and spec.description]
+    return json.dumps({"function_declarations": [spec.manifest_entry() for spec in specs]}, separators=(",", ":"))
+
+
+def planner_manifest_json() -> str:
+    # Serialized once per set of enabled tools; the planner embeds it verbatim in every prompt
+    return _manifest_json(tuple(spec.name for spec in _TOOL_SPECS if spec.enabled()))
+
+
+_shared_calls: ContextVar[Optional[Dict[str, asyncio.Future]]] = ContextVar("shared_tool_calls", default=None)
+_bypass_cache: ContextVar[bool] = ContextVar("bypass_tool_cache", default=False)
+
 
 class ToolRegistry:
     def __init__(self):
-        espy_enabled = os.getenv("ESPY_ENABLE", "false").lower() == "true"
-        tools: List[BaseTool] = [
-            GitHubTool(),
-            GitHubExtrasTool(),
-            LinkedInFinderTool(),
-            LinkedInVerifyTool(),
-            XFinderTool(),
-            XVerifyTool(),
-            NumverifyTool(),
-            HoleheCliTool(),
-            HoleheResolverTool(),
-            GHuntTool(),
-            IgnorantCliTool(),
-            HyperbrowserExtractTool(),
-            HyperbrowserScrapeTool(),
-            HyperbrowserCrawlTool(),
-        ]
-        if espy_enabled:
-            tools.append(EspyEmailTool())
-            tools.append(EspyCourtRecordsTool())
-            tools.append(EspyPhoneTool())
-            tools.append(EspyNameTool())
-            tools.append(EspyDeepwebTool())
+        tools: List[BaseTool] = [LazyTool(spec) for spec in _TOOL_SPECS if spec.enabled()]  # type: ignore[misc]
         self._tools = tools
         self._log = logging.getLogger(__name__)
+        # Per-tool bulkheads are taken before the global one, so a slow provider holds at most its own cap
+        self._global_limit = Bulkhead(
+            "global",
+            int(os.getenv("TOOL_GLOBAL_MAX_INFLIGHT", "64")),
+            int(os.getenv("TOOL_GLOBAL_MAX_QUEUE", "0")),
+        )
+        self._limits: Dict[str, Bulkhead] = {}
+        self._policies: Dict[str, ExecutionPolicy] = {}
+        self._latencies: Dict[str, LatencyWindow] = {}
+        self.stats = ToolStats()
+        self._results = build_cache("tool_results", "TOOL_CACHE", default_max_entries=4096)
+        self._index: Optional[Dict[FrozenSet[str], List[BaseTool]]] = None
+
+    def get_tool(self, name: str) -> Optional[BaseTool]:
+        for t in self._tools:
+            if t.name == name:
+                return t
+        return None
 
     def get_tools_by_stage(self, stage: str) -> List[BaseTool]:
         return [t for t in self._tools if t.stage == stage]
 
+    def in_registry_order(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Aggregated responses (and their cache entries) list results in registry order, whatever order they
+        # finished in; repeated tools (chained calls) are ordered by what triggered them
+        index = {t.name: i for i, t in enumerate(self._tools)}
+
+        def _key(r: Dict[str, Any]) -> Tuple[int, str]:
+            meta = r.get("meta") or {}
+            return index.get(meta.get("tool"), len(index)), json.dumps(meta.get("chained_from") or {}, sort_keys=True)
+
+        return sorted(results, key=_key)
+
+    def _requires_index(self) -> Dict[FrozenSet[str], List[BaseTool]]:
+        # Required input-key set -> tools; tools that declare nothing are indexed under the empty set
+        if self._index is None:
+            index: Dict[FrozenSet[str], List[BaseTool]] = {}
+            for tool in self._tools:
+                for keys in tool.requires or ((),):
+                    bucket = index.setdefault(frozenset(keys), [])
+                    if tool not in bucket:
+                        bucket.append(tool)
+            self._index = index
+        return self._index
+
+    def candidate_tools(self, params: Dict[str, Any], stage: Optional[str] = None) -> List[BaseTool]:
+        # Tools whose declared inputs are present, in registry order; can_handle is not consulted
+        present = {k for k, v in params.items() if v}
+        matched = set()
+        for keys, tools in self._requires_index().items():
+            if keys <= present:
+                matched.update(id(t) for t in tools)
+        return [t for t in self._tools if id(t) in matched and (stage is None or t.stage == stage)]
+
+    def consumers_of(self, param: str, stage: Optional[str] = None) -> List[BaseTool]:
+        # Tools that declare `param` among their inputs (e.g. the verifier of a finder's best URL)
+        return [t for t in self._tools if any(param in keys for keys in t.requires) and (stage is None or t.stage == stage)]
+
     def get_applicable_tools(self, params: Dict[str, Any], stage: Optional[str] = None) -> List[BaseTool]:
-        tools = self._tools if stage is None else self.get_tools_by_stage(stage)
-        applicable = [tool for tool in tools if tool.can_handle(params)]
+        # The index narrows the candidates so can_handle (and the tool's import) only runs where inputs fit
+        applicable = [tool for tool in self.candidate_tools(params, stage) if tool.can_handle(params)]
+        applicable, skipped = self.stats.select(applicable, params)
+        if skipped:
+            self._log.info("Adaptive selection skipped low-yield tools: %s", [t.name for t in skipped])
         self._log.info("Applicable tools stage=%s: %s", stage, [t.name for t in applicable])
         return applicable
 
-    async def execute_tools(self, params: Dict[str, Any], stage: Optional[str] = None) -> List[Dict[str, Any]]:
-        applicable_tools = self.get_applicable_tools(params, stage)
-        tasks = [tool.execute(params) for tool in applicable_tools]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        data_list: List[Dict[str, Any]] = []
-        for r in results:
-            if isinstance(r, Exception):
-                data_list.append({"source": "error", "raw_data": {}, "error": str(r)})
-            else:
-                data_list.append(r)
+    @contextlib.contextmanager
+    def shared_calls(self) -> Iterator[None]:
+        # Within this scope (and tasks spawned from it) identical tool calls, by BaseTool.call_key, run once
+        token = _shared_calls.set({})
+        try:
+            yield
+        finally:
+            _shared_calls.reset(token)
+
+    @contextlib.contextmanager
+    def bypass_cache(self, enabled: bool = True) -> Iterator[None]:
+        # Within this scope cached tool results are ignored (fresh results are still stored)
+        token = _bypass_cache.set(enabled)
+        try:
+            yield
+        finally:
+            _bypass_cache.reset(token)
+
+    async def run_tool(self, tool: BaseTool, params: Dict[str, Any]) -> Dict[str, Any]:
+        scope = _shared_calls.get()
+        key = tool.call_key(params) if scope is not None else None
+        if not key:
+            return await self._run_tool(tool, params)
+        fut = scope.get(key)
+        if fut is None:
+            fut = asyncio.ensure_future(self._run_tool(tool, params))
+            scope[key] = fut
+            return dict(await asyncio.shield(fut))
+        self._log.info("Sharing in-flight call %s", tool.name)
+        result = dict(await asyncio.shield(fut))
+        # Marked so the one call is not credited (or counted) once per caller
+        result["meta"] = {**(result.get("meta") or {}), "shared": True}
+        return result
+
+    async def _run_tool(self, tool: BaseTool, params: Dict[str, Any]) -> Dict[str, Any]:
+        ttl_s, negative_ttl_s = self._cache_ttls(tool)
+        cache_key = tool.call_key(params) if ttl_s > 0 or negative_ttl_s > 0 else None
+        if cache_key and not _bypass_cache.get():
+            cached = self._results.get(cache_key)
+            if cached is not None:
+                hit = dict(cached)
+                hit["meta"] = {**(cached.get("meta") or {}), "tool": tool.name, "cached": True, "queue_wait_ms": 0, "attempts": 0}
+                return hit
+        timing: Dict[str, Any] = {"attempts": 0, "hedged": False, "timed_out": False, "queue_wait_s": 0.0}
+        t0 = time.monotonic()
+        result = await self._execute(tool, params, timing)
+        # Calls rejected or cut short by the system itself say nothing about the tool
+        if (result.get("raw_data") or {}).get("status") not in {"queue_full", "circuit_open", "deadline_exceeded"}:
+            self.stats.record_call(tool.name, params, time.monotonic() - t0 - timing["queue_wait_s"], bool(result_error(result)))
+        # Tag every result with the tool that produced it ("source" is a display label, errors share one)
+        meta = result.setdefault("meta", {})
+        meta["tool"] = tool.name
+        meta["queue_wait_ms"] = int(timing["queue_wait_s"] * 1000)
+        meta["attempts"] = timing["attempts"]
+        meta["hedged"] = timing["hedged"]
+        meta["timed_out"] = timing["timed_out"]
+        # Errors (including deadline/queue/circuit/timeout records) are never cached; of the rest,
+        # negative answers (nothing found) are kept briefly
+        if cache_key and not result_error(result):
+            # The cache keeps its own copy: callers annotate the returned dict (e.g. meta.chained_from)
+            stored = {**result, "meta": dict(meta)}
+            self._results.set(cache_key, stored, negative_ttl_s if tool.is_negative(result) else ttl_s)
+        return result
+
+    async def _execute(self, tool: BaseTool, params: Dict[str, Any], timing: Dict[str, Any]) -> Dict[str, Any]:
+        deadline = current_deadline()
+        try:
+            return await within_deadline(self._with_policy(tool, params, timing))
+        except BulkheadFull as e:
+            self._log.warning("Tool %s rejected: %s queue is full", tool.name, e)
+            return {"source": "error", "raw_data": {"tool": tool.name, "status": "queue_full"}, "error": "queue_full"}
+        except CircuitOpen as e:
+            self._log.info("Tool %s skipped: circuit open for provider %s", tool.name, e)
+            return {"source": "error", "raw_data": {"tool": tool.name, "provider": str(e), "status": "circuit_open"}, "error": "circuit_open"}
+        except asyncio.TimeoutError as e:
+            if deadline is not None and deadline.expired():
+                self._log.warning("Tool %s cancelled at request deadline", tool.name)
+                return {"source": "error", "raw_data": {"tool": tool.name, "status": "deadline_exceeded"}, "error": "deadline_exceeded"}
+            return {"source": "error", "raw_data": {"tool": tool.name, "status": "timeout"}, "error": str(e) or "timeout"}
+        except Exception as e:
+            return {"source": "error", "raw_data": {}, "error": str(e)}
+
+    async def _with_policy(self, tool: BaseTool, params: Dict[str, Any], timing: Dict[str, Any]) -> Dict[str, Any]:
+        # Retries exceptions and per-tool timeouts (and, if the tool opts in, transient error results)
+        # with jittered backoff; the request deadline still bounds the whole loop
+        policy = self._policy(tool)
+        while True:
+            timing["attempts"] += 1
+            try:
+                result = await self._hedged(tool, params, timing, policy)
+                if not (policy.retry_on_error and timing["attempts"] <= policy.retries and is_transient_result(result)):
+                    return result
+                self._log.info("Tool %s attempt %d returned a transient error, retrying", tool.name, timing["attempts"])
+            except (BulkheadFull, CircuitOpen):
+                raise
+            except Exception as e:
+                if isinstance(e, asyncio.TimeoutError):
+                    timing["timed_out"] = True
+                if timing["attempts"] > policy.retries:
+                    raise
+                self._log.info("Tool %s attempt %d failed (%s), retrying", tool.name, timing["attempts"], type(e).__name__)
+            await asyncio.sleep(policy.backoff(timing["attempts"]))
+
+    async def _hedged(self, tool: BaseTool, params: Dict[str, Any], timing: Dict[str, Any], policy: ExecutionPolicy) -> Dict[str, Any]:
+        # Once an attempt outlives the tool's observed p95, a duplicate is sent and the first good answer wins
+        hedge_after = self._latency(tool).percentile(0.95) if policy.hedge else None
+        tasks = [asyncio.ensure_future(self._guarded(tool, params, timing, policy))]
+        try:
+            if hedge_after is not None:
+                done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+                if not done:
+                    self._log.info("Hedging %s after %.2fs", tool.name, hedge_after)
+                    timing["hedged"] = True
+                    tasks.append(asyncio.ensure_future(self._guarded(tool, params, timing, policy)))
+            pending = set(tasks)
+            first: Optional[asyncio.Future] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for t in done:
+                    first = first or t
+                    if not t.exception() and not result_error(t.result()):
+                        return t.result()
+            return first.result()
+        finally:
+            for t in tasks:
+                t.cancel()
+
+    async def _guarded(self, tool: BaseTool, params: Dict[str, Any], timing: Dict[str, Any], policy: ExecutionPolicy) -> Dict[str, Any]:
+        async with self._limit(tool).slot() as tool_wait:
+            async with self._global_limit.slot() as global_wait:
+                timing["queue_wait_s"] += tool_wait + global_wait
+                t0 = time.monotonic()
+
+                async def _call() -> Dict[str, Any]:
+                    if policy.timeout_s:
+                        return await asyncio.wait_for(tool.execute(params), timeout=policy.timeout_s)
+                    return await tool.execute(params)
+
+                if tool.provider:
+                    result = await get_breaker(tool.provider).call(_call, is_transient_result)
+                else:
+                    result = await _call()
+                if not result_error(result):
+                    self._latency(tool).add(time.monotonic() - t0)
+                return result
+
+    def _policy(self, tool: BaseTool) -> ExecutionPolicy:
+        policy = self._policies.get(tool.name)
+        if policy is None:
+            default_timeout = os.getenv("TOOL_DEFAULT_TIMEOUT_S", "60")
+            policy = ExecutionPolicy(
+                timeout_s=float(self._tool_setting(tool, "TIMEOUT_S", default_timeout if tool.timeout_s is None else tool.timeout_s)),
+                retries=int(self._tool_setting(tool, "RETRIES", tool.retries)),
+                retry_on_error=self._tool_setting(tool, "RETRY_ON_ERROR", tool.retry_on_error).lower() == "true",
+                hedge=self._tool_setting(tool, "HEDGE", tool.hedge).lower() == "true",
+                backoff_s=int(os.getenv("TOOL_RETRY_BACKOFF_MS", "200")) / 1000.0,
+            )
+            self._policies[tool.name] = policy
+        return policy
+
+    def _cache_ttls(self, tool: BaseTool) -> Tuple[float, float]:
+        return (
+            float(self._tool_setting(tool, "CACHE_TTL_S", tool.cache_ttl_s)),
+            float(self._tool_setting(tool, "NEGATIVE_CACHE_TTL_S", tool.negative_cache_ttl_s)),
+        )
+
+    def cache_stats(self) -> Dict[str, Any]:
+        return self._results.stats()
+
+    def _latency(self, tool: BaseTool) -> LatencyWindow:
+        window = self._latencies.get(tool.name)
+        if window is None:
+            window = LatencyWindow(min_samples=int(os.getenv("TOOL_HEDGE_MIN_SAMPLES", "20")))
+            self._latencies[tool.name] = window
+        return window
+
+    def _limit(self, tool: BaseTool) -> Bulkhead:
+        limit = self._limits.get(tool.name)
+        if limit is None:
+            limit = Bulkhead(
+                tool.name,
+                int(self._tool_setting(tool, "MAX_INFLIGHT", tool.max_inflight)),
+                int(self._tool_setting(tool, "MAX_QUEUE", tool.max_queue)),
+            )
+            self._limits[tool.name] = limit
+        return limit
+
+    def _tool_setting(self, tool: BaseTool, setting: str, default: Any) -> str:
+        # TOOL_<NAME>_<SETTING> overrides the tool's own default, e.g. TOOL_HOLEHE_CLI_MAX_INFLIGHT
+        env_name = re.sub(r"[^A-Z0-9]+", "_", tool.name.upper())
+        return os.getenv(f"TOOL_{env_name}_{setting}", str(default))
+
+    def limit_stats(self) -> Dict[str, Any]:
+        return {"global": self._global_limit.stats(), "tools": {name: b.stats() for name, b in self._limits.items()}}
+
+    def user_input_results(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
         if params.get("location"):
-            data_list.append({"source": "user_input", "raw_data": {"location": params["location"]}})
-        return data_list
+            return [{"source": "user_input", "raw_data": {"location": params["location"]}}]
+        return []
+
+    async def iter_tools(
+        self,
+        params: Dict[str, Any],
+        stage: Optional[str] = None,
+        tools: Optional[List[BaseTool]] = None,
+        chain: Optional[ToolChain] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        # Yields each tool result as soon as it completes (completion order; see in_registry_order)
+        if tools is None:
+            tools = self.get_applicable_tools(params, stage)
+        async for r in self.iter_calls([(tool, params, 0, None) for tool in tools], chain):
+            yield r
+
+    async def iter_calls(self, calls: List[Tuple[BaseTool, Dict[str, Any], int, Optional[Dict[str, Any]]]], chain: Optional[ToolChain] = None) -> AsyncIterator[Dict[str, Any]]:
+        # Runs (tool, params, depth, chained_from) calls; with a chain, tools triggered by a result join the run
+        pending: Dict[asyncio.Future, Tuple[Dict[str, Any], int, Optional[Dict[str, Any]]]] = {}
+
+        def _start(items: List[Tuple[BaseTool, Dict[str, Any], int, Optional[Dict[str, Any]]]]) -> None:
+            for tool, tool_params, depth, origin in items:
+                if origin is not None:
+                    self._log.info("Chaining %s from %s (%s)", tool.name, origin["tool"], origin["param"])
+                pending[asyncio.ensure_future(self.run_tool(tool, tool_params))] = (tool_params, depth, origin)
+
+        _start(calls)
+        try:
+            while pending:
+                done, _ = await asyncio.wait(list(pending), return_when=asyncio.FIRST_COMPLETED)
+                for fut in done:
+                    tool_params, depth, origin = pending.pop(fut)
+                    result = fut.result()
+                    if origin is not None:
+                        result["meta"] = {**(result.get("meta") or {}), "chained_from": origin}
+                    if chain is not None:
+                        _start(chain.follow(result, tool_params, depth))
+                    yield result
+        finally:
+            for t in pending:
+                t.cancel()
@@ -1,11 +1,21 @@
 import os
 import re
-from typing import Dict, Any, List, Tuple
-import httpx
+from typing import Dict, Any, List, Optional, Tuple
+from services.http import error_fields, get_client
 from .base import BaseTool
 
 
 class XFinderTool(BaseTool):
+    waits_for = ("mkt", "search_hint")
+    key_params = ("name", "username", "location", "company", "search_hint", "mkt")
+    max_inflight = 8
+    timeout_s = 30
+    retries = 1
+    retry_on_error = True
+    provider = "serpapi"
+    cache_ttl_s = 21600
+    negative_cache_ttl_s = 1800
+
     @property
     def name(self) -> str:
         return "x_finder"
@@ -21,6 +31,10 @@ class XFinderTool(BaseTool):
         api_key = os.getenv("SERPAPI_API_KEY")
         return self._enabled() and bool(api_key) and bool(params.get("name") or params.get("username"))
 
+    def is_negative(self, result: Dict[str, Any]) -> bool:
+        data = result.get("raw_data") or {}
+        return not data.get("error") and not data.get("best_url")
+
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         api_key = os.getenv("SERPAPI_API_KEY")
         name = (params.get("name") or "").strip()
@@ -33,25 +47,35 @@ class XFinderTool(BaseTool):
         mkt_default = os.getenv("X_FINDER_MKT_DEFAULT", "en-US")
         timeout_s = int(os.getenv("X_FINDER_TIMEOUT_S", "10"))
 
-        mkt = self._infer_mkt(location) or mkt_default
+        mkt = self._infer_mkt(location) or params.get("mkt") or mkt_default
         queries = self._build_queries(name, username, company, location, hint)[:max_queries]
         seen: Dict[str, float] = {}
+        failed = 0
+        last_error: Optional[BaseException] = None
+
+        client = get_client()
+        for q in queries:
+            try:
+                res = await client.get(
+                    "https://serpapi.com/search",
+                    params={"engine": "bing", "q": q, "api_key": api_key, "mkt": mkt},
+                    timeout=timeout_s,
+                )
+                res.raise_for_status()
+                data = res.json()
+                items = data.get("organic_results") or []
+                for url, title, snippet in self._extract_x(items):
+                    score = self._score(title, snippet, name, username, company, location)
+                    seen[url] = max(seen.get(url, 0.0), score)
+            except Exception as e:
+                failed += 1
+                last_error = e
+                continue
 
-        async with httpx.AsyncClient(timeout=timeout_s) as client:
-            for q in queries:
-                try:
-                    res = await client.get(
-                        "https://serpapi.com/search",
-                        params={"engine": "bing", "q": q, "api_key": api_key, "mkt": mkt},
-                    )
-                    res.raise_for_status()
-                    data = res.json()
-                    items = data.get("organic_results") or []
-                    for url, title, snippet in self._extract_x(items):
-                        score = self._score(title, snippet, name, username, company, location)
-                        seen[url] = max(seen.get(url, 0.0), score)
-                except Exception:
-                    continue
+        if last_error is not None and failed == len(queries):
+            # Every query failed (outage, 5xx, bad key): report an error so it is retried, counted by the
+            # serpapi breaker and never cached as "no profile found"
+            return {"source": "X-Finder", "raw_data": {**error_fields(last_error), "queries": queries, "mkt": mkt}}
 
         ranked = sorted(seen.items(), key=lambda kv: kv[1], reverse=True)[:max_results]
         candidates = [
@@ -1,10 +1,17 @@
 import os
 from typing import Dict, Any
-import requests
+from services.http import error_fields, get_client
 from .base import BaseTool
 
 
 class XVerifyTool(BaseTool):
+    key_params = ("x_finder_best_url",)
+    timeout_s = 25
+    retries = 1
+    retry_on_error = True
+    provider = "scrapingdog"
+    cache_ttl_s = 21600
+
     @property
     def name(self) -> str:
         return "x_verify"
@@ -29,7 +36,7 @@ class XVerifyTool(BaseTool):
         url = params.get("x_finder_best_url")
         timeout_s = int(os.getenv("X_VERIFY_TIMEOUT_S", "20"))
         try:
-            r = requests.get(
+            r = await get_client().get(
                 "https://api.scrapingdog.com/x/profile",
                 params={
                     "api_key": api_key,
@@ -41,7 +48,7 @@ class XVerifyTool(BaseTool):
             r.raise_for_status()
             data = r.json()
         except Exception as e:
-            return {"source": "X-Verify", "raw_data": {"error": str(e), "url": url}}
+            return {"source": "X-Verify", "raw_data": {**error_fields(e), "url": url}}
 
         return {"source": "X-Verify", "raw_data": data}
 